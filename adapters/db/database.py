@@ -6,16 +6,53 @@ Database connection and schema management.
 import os
 import sqlite3
 import threading
+import uuid
 from typing import Optional
 
 DEFAULT_DB_PATH = os.getenv("CHEF_AGENT_DB_PATH", "chef_agent.db")
 
+# FULL syncs the WAL on every commit, so committed transactions survive a
+# power loss. NORMAL only syncs at checkpoints: still safe from corruption,
+# but the most recent commits can be lost. Use NORMAL only where that is
+# acceptable, e.g. test databases.
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+DEFAULT_SYNCHRONOUS = os.getenv("CHEF_AGENT_DB_SYNCHRONOUS", "FULL")
+
 
 class Database:
     """SQLite database connection and schema management."""
 
-    def __init__(self, db_path: str = None):
+    def __init__(
+        self,
+        db_path: str = None,
+        shared_cache: bool = False,
+        synchronous: Optional[str] = None,
+    ):
+        """Open the database and run migrations.
+
+        Each plain ":memory:" connection opens its own empty database, so
+        only the thread that ran the migrations sees the schema. Pass
+        shared_cache=True to name a shared-cache in-memory database per
+        instance that every thread-local connection attaches to. Shared
+        cache uses table locks: a conflicting writer gets SQLITE_LOCKED
+        right away instead of waiting on busy_timeout, so concurrent
+        writers must be serialized (the repositories hold their own lock).
+
+        synchronous sets PRAGMA synchronous (see SYNCHRONOUS_MODES) and
+        defaults to CHEF_AGENT_DB_SYNCHRONOUS or FULL.
+        """
         self.db_path = db_path or DEFAULT_DB_PATH
+        self.synchronous = (synchronous or DEFAULT_SYNCHRONOUS).upper()
+        if self.synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(
+                f"synchronous must be one of {', '.join(SYNCHRONOUS_MODES)}, "
+                f"got {self.synchronous!r}"
+            )
+        self._uri: Optional[str] = None
+        if shared_cache and self.db_path == ":memory:":
+            self._uri = (
+                f"file:chef_agent_{uuid.uuid4().hex}?mode=memory&cache=shared"
+            )
         self._connection: Optional[sqlite3.Connection] = None
         self._local = threading.local()
         self._run_migrations()
@@ -28,11 +65,17 @@ class Database:
             or self._local.connection is None
         ):
             self._local.connection = sqlite3.connect(
-                self.db_path, check_same_thread=False
+                self._uri or self.db_path,
+                check_same_thread=False,
+                uri=self._uri is not None,
             )
             self._local.connection.row_factory = sqlite3.Row
             # Enable WAL mode for better concurrency
             self._local.connection.execute("PRAGMA journal_mode=WAL")
+            # Durability trade-off, see DEFAULT_SYNCHRONOUS
+            self._local.connection.execute(
+                f"PRAGMA synchronous={self.synchronous}"
+            )
             # Set busy timeout for better handling of concurrent access
             self._local.connection.execute("PRAGMA busy_timeout = 10000")
             # Enable foreign key constraints
@@ -84,6 +127,11 @@ class Database:
         conn.commit()
         return cursor.rowcount
 
+    def execute_script(self, script: str) -> None:
+        """Execute a multi-statement SQL script in a single call."""
+        conn = self.get_connection()
+        conn.executescript(script)
+
     def execute_update_in_transaction(
         self, query: str, params: tuple = ()
     ) -> int:
@@ -112,9 +160,13 @@ class Database:
         return cursor.lastrowid
 
     def begin_transaction(self) -> None:
-        """Begin a database transaction."""
+        """Begin a database transaction.
+
+        The write lock is taken up front so that a transaction which reads
+        before writing waits on busy_timeout instead of failing to upgrade.
+        """
         conn = self.get_connection()
-        conn.execute("BEGIN TRANSACTION")
+        conn.execute("BEGIN IMMEDIATE TRANSACTION")
 
     def commit_transaction(self) -> None:
         """Commit the current transaction."""
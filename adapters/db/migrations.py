@@ -132,6 +132,10 @@ class MigrationRunner:
             elif char == string_char:
                 string_char = None
             elif char == ";" and string_char is None:
+                # Trigger bodies contain semicolons; keep them until END
+                if self._in_trigger_body(current_statement):
+                    current_statement += char
+                    continue
                 if current_statement.strip():
                     statements.append(current_statement.strip())
                 current_statement = ""
@@ -144,3 +148,9 @@ class MigrationRunner:
             statements.append(current_statement.strip())
 
         return statements
+
+    @staticmethod
+    def _in_trigger_body(statement: str) -> bool:
+        """Check if a statement is a trigger whose body is not closed yet."""
+        words = statement.upper().split()
+        return words[:2] == ["CREATE", "TRIGGER"] and words[-1] != "END"
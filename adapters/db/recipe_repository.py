@@ -20,6 +20,7 @@ class SQLiteRecipeRepository(RecipeRepository):
     def __init__(self, db: Database):
         self.db = db
         self._lock = threading.RLock()  # Reentrant lock for thread safety
+        self._has_fts: Optional[bool] = None  # Resolved on first search
 
     def _validate_user_id(self, user_id: str) -> None:
         """Validate user_id format and content."""
@@ -94,6 +95,29 @@ class SQLiteRecipeRepository(RecipeRepository):
         """Search recipes by diet type."""
         return self.search_by_tags([diet_type.value], limit)
 
+    def _fts_match(self, terms: List[str], columns: str) -> Optional[str]:
+        """Build an FTS5 MATCH expression if the index can serve the terms.
+
+        Returns None when the recipes_fts table is missing or a term is too
+        short for the trigram tokenizer, so callers fall back to LIKE.
+        """
+        if any(len(term) < 3 for term in terms):
+            return None
+
+        if self._has_fts is None:
+            self._has_fts = bool(
+                self.db.execute_query(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'recipes_fts'"
+                )
+            )
+        if not self._has_fts:
+            return None
+
+        phrases = " OR ".join(
+            '"' + term.replace('"', '""') + '"' for term in terms
+        )
+        return f"{columns} : ({phrases})"
+
     def search_by_keywords(
         self, keywords: List[str], limit: int = 10
     ) -> List[Recipe]:
@@ -101,6 +125,19 @@ class SQLiteRecipeRepository(RecipeRepository):
         if not keywords:
             return []
 
+        match = self._fts_match(keywords, "{title description}")
+        if match is not None:
+            query = """
+                SELECT r.*, ri.ingredients
+                FROM recipes_fts f
+                JOIN recipes r ON r.id = f.rowid
+                LEFT JOIN recipe_ingredients ri ON r.id = ri.recipe_id
+                WHERE recipes_fts MATCH ?
+                LIMIT ?
+            """
+            rows = self.db.execute_query(query, (match, limit))
+            return [self._row_to_recipe(row) for row in rows]
+
         # Create search conditions for each keyword
         conditions = []
         params = []
@@ -274,16 +311,26 @@ class SQLiteRecipeRepository(RecipeRepository):
             conditions.append("r.user_id = ?")
             params.append(user_id)
 
-        # Add text search filter
+        # Add text search filter, served by the FTS index when possible
         if query:
-            conditions.append(
-                "(r.title LIKE ? OR r.description LIKE ? OR "
-                "r.instructions LIKE ?)"
+            match = self._fts_match(
+                [query], "{title description instructions}"
             )
-            # Escape SQL wildcards to prevent injection
-            escaped_query = query.replace("%", "\\%").replace("_", "\\_")
-            search_term = f"%{escaped_query}%"
-            params.extend([search_term, search_term, search_term])
+            if match is not None:
+                conditions.append(
+                    "r.id IN (SELECT rowid FROM recipes_fts "
+                    "WHERE recipes_fts MATCH ?)"
+                )
+                params.append(match)
+            else:
+                conditions.append(
+                    "(r.title LIKE ? OR r.description LIKE ? OR "
+                    "r.instructions LIKE ?)"
+                )
+                # Escape SQL wildcards to prevent injection
+                escaped_query = query.replace("%", "\\%").replace("_", "\\_")
+                search_term = f"%{escaped_query}%"
+                params.extend([search_term, search_term, search_term])
 
         # Add diet type filter
         if diet_type:
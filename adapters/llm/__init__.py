@@ -6,6 +6,7 @@ including Groq, OpenAI, and others.
 """
 
 from .base import BaseLLM, LLMProvider
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
 from .factory import LLMFactory
 from .groq_adapter import GroqAdapter
 from .openai_adapter import OpenAIAdapter
@@ -13,6 +14,9 @@ from .openai_adapter import OpenAIAdapter
 __all__ = [
     "BaseLLM",
     "LLMProvider",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
     "LLMFactory",
     "GroqAdapter",
     "OpenAIAdapter",
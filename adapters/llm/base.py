@@ -7,10 +7,12 @@ and the supported provider types.
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List
 
 from langchain_core.messages import BaseMessage
 
+from .circuit_breaker import CircuitBreaker
+
 
 class LLMProvider(str, Enum):
     """Supported LLM providers."""
@@ -21,6 +23,34 @@ class LLMProvider(str, Enum):
     OLLAMA = "ollama"
 
 
+class GuardedRunnable:
+    """A bound runnable whose calls go through its adapter's breaker.
+
+    Attributes other than invoke and ainvoke are read from the wrapped
+    runnable.
+    """
+
+    def __init__(self, adapter: "BaseLLM", runnable: Any):
+        """Wrap runnable so its calls use adapter's circuit breaker."""
+        self._adapter = adapter
+        self.runnable = runnable
+
+    def invoke(self, *args, **kwargs) -> Any:
+        """Invoke the runnable synchronously through the breaker."""
+        return self._adapter._call_guarded(
+            self.runnable.invoke, *args, **kwargs
+        )
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        """Invoke the runnable asynchronously through the breaker."""
+        return await self._adapter._acall_guarded(
+            self.runnable.ainvoke, *args, **kwargs
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.runnable, name)
+
+
 class BaseLLM(ABC):
     """Abstract base class for LLM adapters."""
 
@@ -36,6 +66,7 @@ class BaseLLM(ABC):
         self.kwargs = kwargs
         self._llm = None
         self._llm_with_tools = None
+        self._circuit_breaker = CircuitBreaker()
 
     @abstractmethod
     def _create_llm(self) -> Any:
@@ -55,11 +86,40 @@ class BaseLLM(ABC):
         return self._llm
 
     def get_llm_with_tools(self, tools: List[Any]) -> Any:
-        """Get LLM instance with tools bound."""
+        """Get LLM instance with tools bound, guarded by the breaker."""
         if self._llm_with_tools is None:
-            self._llm_with_tools = self._create_llm_with_tools(tools)
+            self._llm_with_tools = GuardedRunnable(
+                self, self._create_llm_with_tools(tools)
+            )
         return self._llm_with_tools
 
+    def _call_guarded(self, call: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a provider call through the circuit breaker."""
+        # Fast-fail while the provider is failing instead of calling it again
+        self._circuit_breaker.before_call()
+        try:
+            response = call(*args, **kwargs)
+        except Exception:
+            self._circuit_breaker.record_failure()
+            raise
+        self._circuit_breaker.record_success()
+        return response
+
+    async def _acall_guarded(
+        self, call: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """Await a provider call through the circuit breaker."""
+        self._circuit_breaker.before_call()
+        try:
+            response = await call(*args, **kwargs)
+        except BaseException:
+            # Cancellation (e.g. a wait_for timeout) counts as a failure too,
+            # otherwise a half-open trial call would never be released
+            self._circuit_breaker.record_failure()
+            raise
+        self._circuit_breaker.record_success()
+        return response
+
     @abstractmethod
     async def ainvoke(self, messages: List[BaseMessage], **kwargs) -> Any:
         """Invoke the LLM asynchronously."""
@@ -71,8 +131,8 @@ class BaseLLM(ABC):
         pass
 
     @abstractmethod
-    def bind_tools(self, tools: List[Any]) -> Any:
-        """Bind tools to the LLM."""
+    def bind_tools(self, tools: List[Any]) -> GuardedRunnable:
+        """Bind tools to the LLM; calls share the adapter's breaker."""
         pass
 
     @abstractmethod
@@ -86,6 +146,7 @@ class BaseLLM(ABC):
         pass
 
     def close(self) -> None:
-        """Close the LLM and clean up resources."""
+        """Close the LLM, clean up resources and reset the breaker."""
         self._llm = None
         self._llm_with_tools = None
+        self._circuit_breaker.reset()
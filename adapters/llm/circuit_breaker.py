@@ -0,0 +1,88 @@
+"""
+Circuit breaker for LLM calls.
+
+This module provides a small circuit breaker that stops calling a failing
+LLM provider after repeated errors and lets a single trial call through
+once the recovery timeout has elapsed.
+"""
+
+import time
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Track consecutive failures and fast-fail while the circuit is open."""
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_timeout: float = 60
+    ):
+        """Initialize the circuit breaker."""
+        if failure_threshold <= 0:
+            raise ValueError("Failure threshold must be positive")
+        if recovery_timeout < 0:
+            raise ValueError("Recovery timeout cannot be negative")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.reset()
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, moving to half-open after the timeout."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if calls are currently rejected.
+
+        While half-open only one trial call is let through; the others are
+        rejected until that call records its success or failure.
+        """
+        state = self.state
+        if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+        elif state is not CircuitState.CLOSED:
+            raise CircuitOpenError(
+                f"Circuit open after {self._failure_count} consecutive "
+                f"failures; retry in {self.recovery_timeout}s"
+            )
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self._failure_count = 0
+        self._state = CircuitState.CLOSED
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed call and open the circuit if needed."""
+        self._failure_count += 1
+        self._trial_in_flight = False
+        if (
+            self._state is CircuitState.HALF_OPEN
+            or self._failure_count >= self.failure_threshold
+        ):
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        """Return the circuit to the closed state."""
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
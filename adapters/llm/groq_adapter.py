@@ -9,7 +9,7 @@ from typing import Any, Dict, List
 from langchain_core.messages import BaseMessage
 from langchain_groq import ChatGroq
 
-from .base import BaseLLM
+from .base import BaseLLM, GuardedRunnable
 
 
 class GroqAdapter(BaseLLM):
@@ -52,7 +52,7 @@ class GroqAdapter(BaseLLM):
 
     async def ainvoke(self, messages: List[BaseMessage], **kwargs) -> Any:
         """Invoke Groq LLM asynchronously."""
-        return await self.llm.ainvoke(messages, **kwargs)
+        return await self._acall_guarded(self.llm.ainvoke, messages, **kwargs)
 
     def invoke(self, messages: List[BaseMessage], **kwargs) -> Any:
         """Invoke Groq LLM synchronously."""
@@ -60,11 +60,12 @@ class GroqAdapter(BaseLLM):
             raise ValueError("Messages list cannot be empty")
         if messages is None:
             raise ValueError("Messages cannot be None")
-        return self.llm.invoke(messages, **kwargs)
 
-    def bind_tools(self, tools: List[Any]) -> ChatGroq:
-        """Bind tools to Groq LLM."""
-        return self.llm.bind_tools(tools)
+        return self._call_guarded(self.llm.invoke, messages, **kwargs)
+
+    def bind_tools(self, tools: List[Any]) -> GuardedRunnable:
+        """Bind tools to Groq LLM behind the circuit breaker."""
+        return GuardedRunnable(self, self.llm.bind_tools(tools))
 
     def get_model_info(self) -> Dict[str, Any]:
         """Get Groq model information."""
@@ -9,7 +9,7 @@ from typing import Any, Dict, List
 from langchain_core.messages import BaseMessage
 from langchain_openai import ChatOpenAI
 
-from .base import BaseLLM
+from .base import BaseLLM, GuardedRunnable
 
 
 class OpenAIAdapter(BaseLLM):
@@ -51,15 +51,15 @@ class OpenAIAdapter(BaseLLM):
 
     async def ainvoke(self, messages: List[BaseMessage], **kwargs) -> Any:
         """Invoke OpenAI LLM asynchronously."""
-        return await self.llm.ainvoke(messages, **kwargs)
+        return await self._acall_guarded(self.llm.ainvoke, messages, **kwargs)
 
     def invoke(self, messages: List[BaseMessage], **kwargs) -> Any:
         """Invoke OpenAI LLM synchronously."""
-        return self.llm.invoke(messages, **kwargs)
+        return self._call_guarded(self.llm.invoke, messages, **kwargs)
 
-    def bind_tools(self, tools: List[Any]) -> ChatOpenAI:
-        """Bind tools to OpenAI LLM."""
-        return self.llm.bind_tools(tools)
+    def bind_tools(self, tools: List[Any]) -> GuardedRunnable:
+        """Bind tools to OpenAI LLM behind the circuit breaker."""
+        return GuardedRunnable(self, self.llm.bind_tools(tools))
 
     def get_model_info(self) -> Dict[str, Any]:
         """Get OpenAI model information."""
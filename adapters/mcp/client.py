@@ -32,6 +32,13 @@ class ChefAgentMCPClient:
         if self.session:
             await self.session.close()
 
+    @staticmethod
+    def _parse_tool_result(result: Any) -> Dict[str, Any]:
+        """Decode a tool result, passing already-parsed dicts through."""
+        if isinstance(result, dict):
+            return result
+        return json.loads(result[0].text)
+
     async def find_recipes(
         self,
         query: str = "",
@@ -64,7 +71,7 @@ class ChefAgentMCPClient:
                 self.session.call_tool("recipe_finder", arguments),
                 timeout=self.timeout,
             )
-            return json.loads(result[0].text)
+            return self._parse_tool_result(result)
         except asyncio.TimeoutError:
             raise RuntimeError(
                 f"Recipe search timed out after {self.timeout} seconds"
@@ -90,7 +97,7 @@ class ChefAgentMCPClient:
                 self.session.call_tool("shopping_list_manager", arguments),
                 timeout=self.timeout,
             )
-            return json.loads(result[0].text)
+            return self._parse_tool_result(result)
         except asyncio.TimeoutError:
             raise RuntimeError(
                 f"Shopping list operation timed out after "
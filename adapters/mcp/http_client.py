@@ -15,17 +15,30 @@ class ChefAgentHTTPMCPClient:
     """HTTP client for Chef Agent MCP server."""
 
     def __init__(
-        self, base_url: str = "http://localhost:8072", timeout: int = 30
+        self,
+        base_url: str = "http://localhost:8072",
+        timeout: int = 30,
+        client: Optional[httpx.AsyncClient] = None,
     ):
-        """Initialize the HTTP MCP client."""
+        """Initialize the HTTP MCP client.
+
+        An existing httpx client can be passed in to share its connection
+        pool; it is then left open by close() for its owner to close.
+        """
         self.base_url = base_url
         # Cap at 10 seconds for better UX
         self.timeout = min(timeout, 10)
-        self.client = httpx.AsyncClient(timeout=self.timeout)
+        self._owns_client = client is None
+        self.client = (
+            client
+            if client is not None
+            else httpx.AsyncClient(timeout=self.timeout)
+        )
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self.client.aclose()
 
     async def find_recipes(
         self,
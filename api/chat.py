@@ -6,7 +6,6 @@ including message processing and conversation management.
 """
 
 import logging
-import re
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -16,6 +15,8 @@ from adapters.mcp.http_client import ChefAgentHTTPMCPClient
 from agent import ChefAgentGraph
 from agent.models import ChatRequest, ChatResponse, ErrorResponse
 
+from .validation import validate_thread_id
+
 logger = logging.getLogger(__name__)
 
 # Create router
@@ -94,17 +95,6 @@ async def chat(
         raise HTTPException(status_code=500, detail=f"{error_msg}: {str(e)}")
 
 
-def validate_thread_id(thread_id: str) -> str:
-    """Validate thread_id format."""
-    if not re.match(r"^[a-zA-Z0-9_-]{3,64}$", thread_id):
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid thread_id format. Must be 3-64 characters, "
-            "alphanumeric, underscore, or dash only.",
-        )
-    return thread_id
-
-
 @router.post(
     "/message",
     response_model=ChatResponse,
@@ -6,7 +6,6 @@ including creation, management, and item manipulation.
 """
 
 import logging
-import re
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -14,6 +13,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from adapters.db import Database, SQLiteShoppingListRepository
 from domain.entities import ShoppingItem, ShoppingList
 
+from .validation import validate_thread_id
+
 logger = logging.getLogger(__name__)
 
 # Create router
@@ -55,17 +56,6 @@ def serialize_shopping_list(shopping_list) -> dict:
     }
 
 
-def validate_thread_id(thread_id: str) -> str:
-    """Validate thread_id format."""
-    if not re.match(r"^[a-zA-Z0-9_-]{3,64}$", thread_id):
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid thread_id format. Must be 3-64 characters, "
-            "alphanumeric, underscore, or dash only.",
-        )
-    return thread_id
-
-
 def validate_shopping_list_size(items: list, max_items: int = 100) -> None:
     """Validate shopping list size."""
     if len(items) > max_items:
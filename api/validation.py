@@ -0,0 +1,21 @@
+"""
+Request parameter validation shared by the API routers.
+"""
+
+import re
+
+from fastapi import HTTPException
+
+# Compiled once; \Z rejects a trailing newline that $ would let through
+_THREAD_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{3,64}\Z")
+
+
+def validate_thread_id(thread_id: str) -> str:
+    """Validate thread_id format."""
+    if not _THREAD_ID_RE.match(thread_id):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid thread_id format. Must be 3-64 characters, "
+            "alphanumeric, underscore, or dash only.",
+        )
+    return thread_id
@@ -7,6 +7,7 @@ logic. They are independent of external technologies (database, API, etc.).
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -38,6 +39,18 @@ def parse_timestamp(timestamp_str: str) -> datetime:
             return None
 
 
+def _sum_quantities(quantities: List[Optional[str]]) -> Optional[str]:
+    """Add up ingredient quantities, or list them if any is not numeric."""
+    if len(quantities) == 1:
+        return quantities[0]
+    try:
+        total = sum(float(quantity) for quantity in quantities)
+    except (TypeError, ValueError):
+        # Missing (None) or free-text quantities are listed as given
+        return " + ".join(str(quantity) for quantity in quantities)
+    return f"{total:g}"
+
+
 class DietType(Enum):
     """Diet types supported by the chef agent."""
 
@@ -51,7 +64,7 @@ class DietType(Enum):
     PALEO = "paleo"
 
 
-@dataclass
+@dataclass(slots=True)
 class Ingredient:
     """Represents an ingredient with quantity and unit."""
 
@@ -69,7 +82,7 @@ class Ingredient:
         return f"{self.quantity} {self.unit} {self.name}{allergen_info}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Recipe:
     """Represents a recipe with ingredients, instructions, and metadata."""
 
@@ -105,6 +118,15 @@ class Recipe:
         if self.servings is not None and self.servings <= 0:
             raise ValueError("servings must be positive")
 
+        # Accept diet type values such as "vegan" so filters only see enums
+        if isinstance(self.diet_type, str):
+            try:
+                self.diet_type = DietType(self.diet_type.lower())
+            except ValueError:
+                raise ValueError(
+                    f"invalid diet_type: {self.diet_type!r}"
+                ) from None
+
         # Validate title
         if not self.title or not self.title.strip():
             raise ValueError("title cannot be empty")
@@ -141,7 +163,7 @@ class Recipe:
         return f"Recipe: {self.title}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ShoppingItem:
     """Represents an item in the shopping list."""
 
@@ -300,6 +322,11 @@ class MealPlan:
         if self.created_at is None:
             self.created_at = get_current_timestamp()
 
+        # Ingredient snapshot and categorized items of the last generated
+        # shopping list; a plain attribute so it stays out of fields and
+        # serialization
+        self._shopping_cache: Optional[tuple] = None
+
     def add_day(self, day: MenuDay) -> None:
         """Add a day to the meal plan."""
         self.days.append(day)
@@ -319,13 +346,45 @@ class MealPlan:
     def get_shopping_list(self) -> ShoppingList:
         """Generate a shopping list from all ingredients in the meal plan.
 
+        Ingredients with the same name and unit are merged into one item;
+        numeric quantities are summed and others are joined with " + ".
+
+        Categorized items are reused while every ingredient's name,
+        quantity and unit are unchanged; every call still returns a new list
+        that the caller may modify.
+
         Returns:
             ShoppingList: A shopping list containing all ingredients
         """
-        shopping_list = ShoppingList()
-        all_ingredients = self.get_all_ingredients()
-        shopping_list.add_ingredients(all_ingredients)
-        return shopping_list
+        # Value snapshot, so recipe swaps and in-place edits both miss
+        snapshot = tuple(
+            (ingredient.name, ingredient.quantity, ingredient.unit)
+            for day in self.days
+            for meal in day.meals
+            for ingredient in meal.recipe.ingredients
+        )
+        cache = self._shopping_cache
+        if cache is not None and cache[0] == snapshot:
+            return ShoppingList(
+                items=[ShoppingItem(*fields) for fields in cache[1]]
+            )
+
+        # Same ingredient in the same unit becomes one item
+        quantities = defaultdict(list)
+        for name, quantity, unit in snapshot:
+            quantities[(name, unit)].append(quantity)
+
+        items = [
+            (
+                name,
+                _sum_quantities(amounts),
+                unit,
+                IngredientCategorizer.categorize_ingredient(name),
+            )
+            for (name, unit), amounts in quantities.items()
+        ]
+        self._shopping_cache = (snapshot, items)
+        return ShoppingList(items=[ShoppingItem(*fields) for fields in items])
 
     def __str__(self) -> str:
         diet_str = self.diet_type.value if self.diet_type else "any"
@@ -6,10 +6,53 @@ diet goals, preferences, and available recipes.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, List, NamedTuple, Optional, Union
 
 from .entities import DietType, Meal, MealPlan, MenuDay, Recipe
 
+# Diet goal names that map directly onto a diet type
+_DIET_GOAL_MAP: dict[str, DietType] = {
+    "low-carb": DietType.LOW_CARB,
+    "vegetarian": DietType.VEGETARIAN,
+    "vegan": DietType.VEGAN,
+    "high-protein": DietType.HIGH_PROTEIN,
+    "keto": DietType.KETO,
+    "mediterranean": DietType.MEDITERRANEAN,
+    "gluten-free": DietType.GLUTEN_FREE,
+    "paleo": DietType.PALEO,
+}
+
+# Diet types a recipe may have to count towards a restrictive diet goal;
+# goals not listed here accept every recipe
+_VEGETARIAN_TYPES = frozenset({DietType.VEGETARIAN, DietType.VEGAN})
+_LOW_CARB_TYPES = frozenset({DietType.LOW_CARB, DietType.KETO})
+_DIET_GOAL_FILTERS: dict[str, frozenset[DietType]] = {
+    "vegetarian": _VEGETARIAN_TYPES,
+    "veggie": _VEGETARIAN_TYPES,
+    "vegan": frozenset({DietType.VEGAN}),
+    "low-carb": _LOW_CARB_TYPES,
+    "keto": _LOW_CARB_TYPES,
+    "gluten-free": frozenset({DietType.GLUTEN_FREE}),
+}
+
+
+def _diet_goal_key(diet_goal: Union[str, DietType, None]) -> str:
+    """Normalize a diet goal string or DietType to a lookup key.
+
+    A missing goal is treated as "regular", which filters nothing and has
+    no diet type.
+    """
+    if isinstance(diet_goal, DietType):
+        return diet_goal.value
+    return diet_goal.lower() if isinstance(diet_goal, str) else "regular"
+
+
+class MealPlanResult(NamedTuple):
+    """A generated meal plan and whether the diet filter fell back."""
+
+    meal_plan: MealPlan
+    fallback_used: bool
+
 
 class MealPlanGenerator:
     """Generates meal plans based on diet goals and preferences."""
@@ -21,21 +64,24 @@ class MealPlanGenerator:
     def generate_meal_plan(
         cls,
         recipes: List[Recipe],
-        diet_goal: str,
+        diet_goal: Union[str, DietType, None],
         days_count: int,
         preferences: Optional[List[str]] = None,
-    ) -> tuple[MealPlan, bool]:
+        now: Callable[[], datetime] = datetime.now,
+    ) -> MealPlanResult:
         """
         Generate a meal plan based on available recipes and preferences.
 
         Args:
             recipes: List of available recipes
-            diet_goal: Diet goal (e.g., 'low-carb', 'vegetarian')
+            diet_goal: Diet goal (e.g., 'low-carb', 'vegetarian') or a
+                DietType
             days_count: Number of days for the meal plan (3-7)
             preferences: Additional preferences
+            now: Clock used for the plan's created_at timestamp
 
         Returns:
-            tuple: (Generated meal plan, fallback_used) where fallback_used
+            MealPlanResult: (meal_plan, fallback_used) where fallback_used
                    indicates if all recipes were used instead of
                    diet-filtered ones
         """
@@ -49,6 +95,9 @@ class MealPlanGenerator:
         if not recipes:
             raise ValueError("Cannot generate meal plan: no recipes available")
 
+        # Resolve the diet goal once for filtering, notes and diet type
+        diet_goal = _diet_goal_key(diet_goal)
+
         # Filter recipes by diet goal
         filtered_recipes = cls._filter_recipes_by_diet(recipes, diet_goal)
         fallback_used = False
@@ -58,110 +107,55 @@ class MealPlanGenerator:
             filtered_recipes = recipes
             fallback_used = True
 
-        # Ensure we have enough recipes for the meal plan
-        if len(filtered_recipes) < days_count * len(cls.MEAL_TYPES):
-            # Duplicate recipes if needed
-            filtered_recipes = cls._expand_recipe_list(
-                filtered_recipes, days_count
-            )
+        # Days take the next meals_per_day recipes from the pool, wrapping
+        # around so every recipe is used before any repeats
+        pool = list(filtered_recipes)
+        meals_per_day = len(cls.MEAL_TYPES)
 
-        # Generate days
         days = []
         for day_num in range(1, days_count + 1):
+            start = (day_num - 1) * meals_per_day
+            day_recipes = [
+                pool[(start + slot) % len(pool)]
+                for slot in range(meals_per_day)
+            ]
             day = cls._generate_menu_day(
-                day_num, filtered_recipes, diet_goal, preferences
+                day_num, day_recipes, diet_goal, preferences
             )
             days.append(day)
 
         # Determine diet type
         diet_type = cls._determine_diet_type(diet_goal)
 
-        return (
+        return MealPlanResult(
             MealPlan(
                 days=days,
                 diet_type=diet_type,
                 total_days=days_count,
-                created_at=datetime.now().isoformat(),
+                created_at=now().isoformat(),
             ),
             fallback_used,
         )
 
     @classmethod
     def _filter_recipes_by_diet(
-        cls, recipes: List[Recipe], diet_goal: str
+        cls, recipes: List[Recipe], diet_goal: Union[str, DietType, None]
     ) -> List[Recipe]:
         """Filter recipes based on diet goal."""
-        diet_goal_lower = diet_goal.lower()
-
-        if diet_goal_lower in ["vegetarian", "veggie"]:
-            filtered = [
-                r
-                for r in recipes
-                if r.diet_type in [DietType.VEGETARIAN, DietType.VEGAN]
-            ]
-            if not filtered:
-                print(
-                    "Warning: No vegetarian recipes found. "
-                    "Consider adding recipes with diet_type "
-                    "VEGETARIAN or VEGAN."
-                )
-            return filtered
-        elif diet_goal_lower in ["vegan"]:
-            filtered = [r for r in recipes if r.diet_type == DietType.VEGAN]
-            if not filtered:
-                print(
-                    "Warning: No vegan recipes found. "
-                    "Consider adding recipes with diet_type VEGAN."
-                )
-            return filtered
-        elif diet_goal_lower in ["low-carb", "keto"]:
-            filtered = [
-                r
-                for r in recipes
-                if r.diet_type in [DietType.LOW_CARB, DietType.KETO]
-            ]
-            if not filtered:
-                print(
-                    "Warning: No low-carb/keto recipes found. "
-                    "Consider adding recipes with diet_type LOW_CARB or KETO."
-                )
-            return filtered
-        elif diet_goal_lower in ["gluten-free"]:
-            filtered = [
-                r for r in recipes if r.diet_type == DietType.GLUTEN_FREE
-            ]
-            if not filtered:
-                print(
-                    "Warning: No gluten-free recipes found. "
-                    "Consider adding recipes with diet_type GLUTEN_FREE."
-                )
-            return filtered
-        else:
+        diet_goal = _diet_goal_key(diet_goal)
+        allowed = _DIET_GOAL_FILTERS.get(diet_goal)
+        if allowed is None:
             # For other diet goals, return all recipes
             return recipes
 
-    @classmethod
-    def _expand_recipe_list(
-        cls, recipes: List[Recipe], days_count: int
-    ) -> List[Recipe]:
-        """Expand recipe list by duplicating recipes if needed."""
-        import random
-
-        needed_recipes = days_count * len(cls.MEAL_TYPES)
-        expanded = recipes.copy()
-
-        # Shuffle recipes to avoid monotonous repetition
-        random.shuffle(expanded)
-
-        while len(expanded) < needed_recipes:
-            # Add shuffled copies to maintain variety
-            shuffled_copy = recipes.copy()
-            random.shuffle(shuffled_copy)
-            expanded.extend(shuffled_copy)
-
-        # Shuffle final result
-        random.shuffle(expanded)
-        return expanded
+        filtered = [r for r in recipes if r.diet_type in allowed]
+        if not filtered:
+            print(
+                f"Warning: No {diet_goal} recipes found. "
+                f"Consider adding recipes with diet_type "
+                f"{' or '.join(sorted(dt.name for dt in allowed))}."
+            )
+        return filtered
 
     @classmethod
     def _generate_menu_day(
@@ -171,26 +165,20 @@ class MealPlanGenerator:
         diet_goal: str,
         preferences: Optional[List[str]] = None,
     ) -> MenuDay:
-        """Generate a single day's menu."""
+        """Generate a single day's menu from its recipes, one per meal."""
         meals = []
-        recipe_index = (day_num - 1) * len(cls.MEAL_TYPES)
         total_calories = 0
 
-        for meal_type in cls.MEAL_TYPES:
-            if recipe_index < len(recipes):
-                recipe = recipes[recipe_index]
-                meal = Meal(
-                    name=meal_type,
-                    recipe=recipe,
-                    notes=cls._generate_meal_notes(meal_type, recipe),
-                )
-                meals.append(meal)
-
-                # Estimate calories for this meal
-                meal_calories = cls._estimate_recipe_calories(recipe)
-                total_calories += meal_calories
+        for meal_type, recipe in zip(cls.MEAL_TYPES, recipes):
+            meal = Meal(
+                name=meal_type,
+                recipe=recipe,
+                notes=cls._generate_meal_notes(meal_type, recipe),
+            )
+            meals.append(meal)
 
-                recipe_index += 1
+            # Estimate calories for this meal
+            total_calories += cls._estimate_recipe_calories(recipe)
 
         return MenuDay(
             day_number=day_num,
@@ -321,35 +309,18 @@ class MealPlanGenerator:
         return int(total_calories)
 
     @classmethod
-    def _determine_diet_type(cls, diet_goal: str) -> Optional[DietType]:
+    def _determine_diet_type(
+        cls, diet_goal: Union[str, DietType, None]
+    ) -> Optional[DietType]:
         """Determine DietType enum from diet goal string."""
-        diet_goal_lower = diet_goal.lower()
-
-        diet_mapping = {
-            "low-carb": DietType.LOW_CARB,
-            "vegetarian": DietType.VEGETARIAN,
-            "vegan": DietType.VEGAN,
-            "high-protein": DietType.HIGH_PROTEIN,
-            "keto": DietType.KETO,
-            "mediterranean": DietType.MEDITERRANEAN,
-            "gluten-free": DietType.GLUTEN_FREE,
-            "paleo": DietType.PALEO,
-        }
-
-        return diet_mapping.get(diet_goal_lower)
+        return _DIET_GOAL_MAP.get(_diet_goal_key(diet_goal))
 
     @classmethod
     def validate_meal_plan(cls, meal_plan: MealPlan) -> bool:
         """Validate that a meal plan meets basic requirements."""
-        if not meal_plan.days:
-            return False
-
-        if meal_plan.total_days < 3 or meal_plan.total_days > 7:
-            return False
-
-        # Check that each day has at least one meal
-        for day in meal_plan.days:
-            if not day.meals:
-                return False
-
-        return True
+        # Cheap checks first; all() stops at the first day without meals
+        return (
+            bool(meal_plan.days)
+            and 3 <= meal_plan.total_days <= 7
+            and all(day.meals for day in meal_plan.days)
+        )
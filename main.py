@@ -20,7 +20,8 @@ def validate_environment():
     # Skip validation during testing
     import sys
 
-    if any("pytest" in arg for arg in sys.argv):
+    # xdist workers are not started with "pytest" in argv
+    if "pytest" in sys.modules or any("pytest" in arg for arg in sys.argv):
         return
 
     from config import settings
@@ -0,0 +1,38 @@
+-- Full-text index over recipe text for keyword search
+-- Migration: 0003_recipes_fts
+
+-- The trigram tokenizer keeps substring semantics of the LIKE search it
+-- replaces; recipe text itself stays in the recipes table
+CREATE VIRTUAL TABLE IF NOT EXISTS recipes_fts USING fts5(
+    title,
+    description,
+    instructions,
+    content='recipes',
+    content_rowid='id',
+    tokenize='trigram'
+);
+
+-- Index recipes that existed before this migration
+INSERT INTO recipes_fts(recipes_fts) VALUES ('rebuild');
+
+-- Keep the index in sync with the recipes table
+CREATE TRIGGER IF NOT EXISTS recipes_fts_ai AFTER INSERT ON recipes BEGIN
+    INSERT INTO recipes_fts(rowid, title, description, instructions)
+    VALUES (new.id, new.title, new.description, new.instructions);
+END;
+
+CREATE TRIGGER IF NOT EXISTS recipes_fts_ad AFTER DELETE ON recipes BEGIN
+    INSERT INTO recipes_fts(
+        recipes_fts, rowid, title, description, instructions
+    )
+    VALUES ('delete', old.id, old.title, old.description, old.instructions);
+END;
+
+CREATE TRIGGER IF NOT EXISTS recipes_fts_au AFTER UPDATE ON recipes BEGIN
+    INSERT INTO recipes_fts(
+        recipes_fts, rowid, title, description, instructions
+    )
+    VALUES ('delete', old.id, old.title, old.description, old.instructions);
+    INSERT INTO recipes_fts(rowid, title, description, instructions)
+    VALUES (new.id, new.title, new.description, new.instructions);
+END;
@@ -0,0 +1,29 @@
+"""
+Lightweight attribute patching for tests.
+"""
+
+from contextlib import ExitStack, contextmanager
+
+
+@contextmanager
+def swap_attr(obj, name, new):
+    """Temporarily replace ``obj.name`` with ``new``.
+
+    Much cheaper than ``patch.object`` when the test does not need call
+    tracking on the replacement.
+    """
+    old = getattr(obj, name)
+    setattr(obj, name, new)
+    try:
+        yield new
+    finally:
+        setattr(obj, name, old)
+
+
+@contextmanager
+def swap_attrs(obj, **replacements):
+    """Temporarily replace several attributes of ``obj`` at once."""
+    with ExitStack() as stack:
+        for name, new in replacements.items():
+            stack.enter_context(swap_attr(obj, name, new))
+        yield obj
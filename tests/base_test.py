@@ -2,8 +2,14 @@
 Base test class with common setup and utilities.
 """
 
+import atexit
+import os
+import shutil
 import tempfile
-from unittest.mock import patch
+from functools import lru_cache
+from unittest.mock import Mock, patch
+
+import pytest
 
 from adapters.db import Database
 from adapters.db.recipe_repository import SQLiteRecipeRepository
@@ -11,6 +17,36 @@ from adapters.db.shopping_list_repository import SQLiteShoppingListRepository
 from adapters.llm.groq_adapter import GroqAdapter
 from adapters.llm.openai_adapter import OpenAIAdapter
 from domain.entities import Ingredient, Recipe
+from tests.fixtures.recipes import TEST_USER_ID
+
+# Clear recipe and shopping list data in one transaction; foreign key
+# checks are skipped since every dependent table is emptied as well
+CLEAR_DATA_SCRIPT = """
+PRAGMA foreign_keys = OFF;
+BEGIN;
+DELETE FROM shopping_lists;
+DELETE FROM recipe_ingredients;
+DELETE FROM recipe_tags;
+DELETE FROM recipes;
+COMMIT;
+PRAGMA foreign_keys = ON;
+"""
+
+# Underlying chat model methods that the LLM adapters call through to
+LLM_MOCK_SPEC = ["ainvoke", "invoke", "bind_tools"]
+
+
+@lru_cache(maxsize=None)
+def _migrated_template_db() -> str:
+    """Return the path of a database with all migrations applied.
+
+    Built once per session; tests copy it instead of re-running the DDL.
+    """
+    template = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    template.close()
+    Database(template.name).close()
+    atexit.register(os.unlink, template.name)
+    return template.name
 
 
 class BaseDatabaseTest:
@@ -20,17 +56,17 @@ class BaseDatabaseTest:
         """Set up test database and repositories."""
         self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
         self.temp_db.close()
+        shutil.copyfile(_migrated_template_db(), self.temp_db.name)
 
-        self.db = Database(self.temp_db.name)
+        # Throwaway database, durability is not needed
+        self.db = Database(self.temp_db.name, synchronous="OFF")
         self.recipe_repo = SQLiteRecipeRepository(self.db)
         self.shopping_repo = SQLiteShoppingListRepository(self.db)
-        self.test_user_id = "test-user-123"
+        self.test_user_id = TEST_USER_ID
 
     def teardown_method(self):
         """Clean up test database."""
         self.db.close()
-        import os
-
         os.unlink(self.temp_db.name)
 
     def create_test_recipe(self, title="Test Recipe", user_id=None):
@@ -57,42 +93,39 @@ class BaseLLMTest:
 
     def create_mock_groq_adapter(self):
         """Create a mock Groq adapter."""
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_chat:
+        with patch("adapters.llm.groq_adapter.ChatGroq"):
             adapter = GroqAdapter(
                 api_key=self.test_api_key,
                 model=self.test_model,
                 temperature=0.7,
                 max_tokens=2048,
             )
-            # Set the mock as the _llm attribute
-            adapter._llm = mock_chat.return_value
+            # Restrict the mock to the methods the adapter forwards to
+            adapter._llm = Mock(spec_set=LLM_MOCK_SPEC)
             return adapter
 
     def create_mock_openai_adapter(self):
         """Create a mock OpenAI adapter."""
-        with patch("adapters.llm.openai_adapter.ChatOpenAI") as mock_chat:
+        with patch("adapters.llm.openai_adapter.ChatOpenAI"):
             adapter = OpenAIAdapter(
                 api_key=self.test_api_key,
                 model=self.test_model,
                 temperature=0.7,
                 max_tokens=2048,
             )
-            # Set the mock as the _llm attribute
-            adapter._llm = mock_chat.return_value
+            # Restrict the mock to the methods the adapter forwards to
+            adapter._llm = Mock(spec_set=LLM_MOCK_SPEC)
             return adapter
 
 
 class BaseAPITest:
     """Base class for API-related tests."""
 
-    def setup_method(self):
-        """Set up test API client."""
-        from fastapi.testclient import TestClient
-
-        from main import app
-
-        self.client = TestClient(app)
-        self.test_user_id = "test-user-123"
+    @pytest.fixture(autouse=True)
+    def _api_client(self, client):
+        """Use the session-wide test client from conftest."""
+        self.client = client
+        self.test_user_id = TEST_USER_ID
 
     def create_test_recipe_data(self, title="Test Recipe"):
         """Create test recipe data for API calls."""
@@ -2,10 +2,14 @@
 Shared test fixtures and utilities.
 """
 
+import asyncio
 import tempfile
+from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
+import pytest_asyncio
 
 from adapters.db import Database
 from adapters.db.recipe_repository import SQLiteRecipeRepository
@@ -14,15 +18,49 @@ from adapters.llm.groq_adapter import GroqAdapter
 from adapters.llm.openai_adapter import OpenAIAdapter
 from adapters.mcp.client import ChefAgentMCPClient
 from agent import ChefAgentGraph
+from agent.tools import set_mcp_client
+from domain.entities import DietType, Ingredient, Recipe
+
+try:
+    # Installed with uvicorn[standard] everywhere except Windows and PyPy
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is available."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 @pytest.fixture
 def temp_database():
-    """Create a temporary database for testing."""
+    """Create a temporary database for testing.
+
+    Throwaway data, so commits skip the fsync that FULL would do.
+    """
     temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
     temp_db.close()
 
-    db = Database(temp_db.name)
+    db = Database(temp_db.name, synchronous="NORMAL")
+    yield db
+
+    db.close()
+    import os
+
+    os.unlink(temp_db.name)
+
+
+@pytest.fixture(scope="class")
+def class_temp_database():
+    """Create a temporary database shared by all tests in a class."""
+    temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    temp_db.close()
+
+    db = Database(temp_db.name, synchronous="NORMAL")
     yield db
 
     db.close()
@@ -31,6 +69,23 @@ def temp_database():
     os.unlink(temp_db.name)
 
 
+@pytest.fixture
+def frozen_now():
+    """Clock that always returns the same time."""
+    return lambda: datetime(2024, 1, 1, 12, 0)
+
+
+@pytest.fixture(scope="module")
+def memory_db():
+    """In-memory database shared by the tests of a module.
+
+    Uses a shared cache so connections from other threads see the schema.
+    """
+    db = Database(":memory:", shared_cache=True)
+    yield db
+    db.close()
+
+
 @pytest.fixture
 def recipe_repo(temp_database):
     """Create recipe repository with temp database."""
@@ -55,14 +110,31 @@ def test_thread_id():
     return "test-thread-456"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Test client for API testing."""
+    """Test client for API testing, shared across the session.
+
+    Entering the client runs the app lifespan once for the whole session
+    instead of skipping it entirely as a bare TestClient(app) does.
+    """
     from fastapi.testclient import TestClient
 
     from main import app
 
-    return TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Async client that drives the ASGI app on the test's event loop."""
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as async_test_client:
+        yield async_test_client
 
 
 @pytest.fixture
@@ -95,9 +167,8 @@ def mock_openai_adapter():
         return adapter
 
 
-@pytest.fixture
-def mock_mcp_client():
-    """Mock MCP client for testing."""
+def _build_mock_mcp_client():
+    """Build a mock MCP client with async methods returning success."""
     client = Mock(spec=ChefAgentMCPClient)
     # Make MCP client methods async for testing and return proper values
     client.find_recipes = AsyncMock(
@@ -122,21 +193,24 @@ def mock_mcp_client():
 
 
 @pytest.fixture
-def mock_chef_agent(mock_mcp_client):
-    """Mock ChefAgentGraph for testing."""
+def mock_mcp_client():
+    """Mock MCP client for testing."""
+    return _build_mock_mcp_client()
+
+
+@pytest.fixture(scope="session")
+def _shared_chef_agent():
+    """ChefAgentGraph built once per session for mock_chef_agent."""
     with patch("agent.graph.LLMFactory") as mock_factory:
         # Create a simple mock LLM without AsyncMock
         mock_llm = Mock()
         mock_factory.create_llm.return_value = mock_llm
 
-        # Create real ChefAgentGraph instance
-        agent = ChefAgentGraph("groq", "test-api-key", mock_mcp_client)
-
-        # Mock the graph.ainvoke method as a simple Mock
-        agent.graph = Mock()
-
-        # Mock memory manager as simple Mock
-        agent.memory_manager = Mock()
+        # Create real ChefAgentGraph instance; compiling the graph is the
+        # expensive part, so it is only done once
+        agent = ChefAgentGraph(
+            "groq", "test-api-key", _build_mock_mcp_client()
+        )
 
         # Ensure the agent has access to the mock_llm
         agent.llm = mock_llm
@@ -144,6 +218,26 @@ def mock_chef_agent(mock_mcp_client):
         return agent
 
 
+@pytest.fixture
+def mock_chef_agent(_shared_chef_agent, mock_mcp_client):
+    """Mock ChefAgentGraph for testing."""
+    agent = _shared_chef_agent
+
+    # Reset per-test state on the shared agent; the tools read the MCP
+    # client from agent.tools, so point them at this test's client too
+    agent.mcp_client = mock_mcp_client
+    set_mcp_client(mock_mcp_client)
+    agent.llm.reset_mock(return_value=True, side_effect=True)
+
+    # Mock the graph.ainvoke method as a simple Mock
+    agent.graph = Mock()
+
+    # Mock memory manager as simple Mock
+    agent.memory_manager = Mock()
+
+    return agent
+
+
 @pytest.fixture
 def mock_llm_factory():
     """Mock LLM factory for tests that need it."""
@@ -223,6 +317,58 @@ def test_shopping_api_data():
     }
 
 
+@pytest.fixture(scope="module")
+def sample_recipes():
+    """Sample recipes shared by a test module; tests must not mutate them."""
+    return [
+        Recipe(
+            id=1,
+            title="Vegetarian Pasta",
+            description="A delicious vegetarian pasta dish",
+            instructions="Cook pasta, add vegetables",
+            ingredients=[
+                Ingredient(name="pasta", quantity="200", unit="g"),
+                Ingredient(name="tomato", quantity="2", unit="pieces"),
+                Ingredient(name="onion", quantity="1", unit="piece"),
+            ],
+            diet_type=DietType.VEGETARIAN,
+            prep_time_minutes=15,
+            cook_time_minutes=20,
+            servings=4,
+        ),
+        Recipe(
+            id=2,
+            title="Chicken Salad",
+            description="Healthy chicken salad",
+            instructions="Mix chicken with vegetables",
+            ingredients=[
+                Ingredient(name="chicken", quantity="300", unit="g"),
+                Ingredient(name="lettuce", quantity="1", unit="head"),
+                Ingredient(name="tomato", quantity="1", unit="piece"),
+            ],
+            diet_type=DietType.HIGH_PROTEIN,
+            prep_time_minutes=10,
+            cook_time_minutes=0,
+            servings=2,
+        ),
+        Recipe(
+            id=3,
+            title="Vegan Curry",
+            description="Spicy vegan curry",
+            instructions="Cook vegetables in curry sauce",
+            ingredients=[
+                Ingredient(name="coconut milk", quantity="400", unit="ml"),
+                Ingredient(name="curry powder", quantity="2", unit="tbsp"),
+                Ingredient(name="potato", quantity="2", unit="pieces"),
+            ],
+            diet_type=DietType.VEGAN,
+            prep_time_minutes=20,
+            cook_time_minutes=30,
+            servings=3,
+        ),
+    ]
+
+
 @pytest.fixture
 def test_api_client():
     """Test client for API testing with common setup."""
@@ -0,0 +1,3 @@
+"""
+Prebuilt test data shared across test modules.
+"""
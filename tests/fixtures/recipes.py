@@ -0,0 +1,49 @@
+"""
+Recipe objects built once at import and shared by tests.
+
+Tests must treat these as read-only.
+"""
+
+from domain.entities import DietType, Ingredient, Recipe
+
+TEST_USER_ID = "test-user-123"
+
+
+def _pasta_fields() -> dict:
+    """Pasta defaults with fresh tag and ingredient lists on every call."""
+    return {
+        "id": 1,
+        "title": "Test Pasta",
+        "description": "A simple pasta dish",
+        "instructions": "Cook pasta, add sauce",
+        "prep_time_minutes": 10,
+        "cook_time_minutes": 15,
+        "servings": 4,
+        "difficulty": "easy",
+        "tags": ["italian", "pasta"],
+        "diet_type": DietType.VEGETARIAN,
+        "ingredients": [
+            Ingredient(name="pasta", quantity="500g", unit="g"),
+            Ingredient(name="tomato sauce", quantity="400ml", unit="ml"),
+        ],
+        "user_id": TEST_USER_ID,
+    }
+
+
+def make_recipe(**overrides) -> Recipe:
+    """Build a test recipe from the pasta defaults with field overrides."""
+    return Recipe(**{**_pasta_fields(), **overrides})
+
+
+MOCK_PASTA = make_recipe()
+
+MOCK_QUICK_PASTA = make_recipe(
+    title="Quick Pasta",
+    description="Fast pasta dish",
+    instructions="Cook quickly",
+    prep_time_minutes=5,
+    cook_time_minutes=10,
+    servings=2,
+    tags=["quick", "pasta"],
+    ingredients=[],
+)
@@ -343,6 +343,22 @@ class TestChefAgentGraph:
         assert "clear_shopping_list" in tool_names
         assert "replace_recipe_in_meal_plan" in tool_names
 
+    async def test_tools_use_per_test_mcp_client(
+        self, mock_chef_agent, mock_mcp_client
+    ):
+        """Test the shared agent's tools call this test's MCP client."""
+        get_list = next(
+            t for t in mock_chef_agent.tools if t.name == "get_shopping_list"
+        )
+        mock_mcp_client.get_shopping_list.return_value = {"items": ["milk"]}
+
+        result = await get_list.ainvoke({"thread_id": "test-thread"})
+
+        assert result["shopping_list"] == {"items": ["milk"]}
+        mock_mcp_client.get_shopping_list.assert_awaited_once_with(
+            "test-thread"
+        )
+
     @pytest.mark.asyncio
     async def test_diet_goal_extraction_through_public_api(
         self, mock_chef_agent
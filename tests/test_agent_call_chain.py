@@ -6,7 +6,7 @@ workflow execution, state transitions, and tool interactions.
 """
 
 import asyncio
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -640,19 +640,22 @@ class TestAgentCallChain:
     @pytest.mark.asyncio
     async def test_agent_error_propagation(self, mock_chef_agent):
         """Test error propagation through agent call chain."""
-        # Mock error in different parts of the chain
+        # The checkpointer loads state inside the graph run, so a memory
+        # failure surfaces from graph.ainvoke
         with patch.object(
-            mock_chef_agent.memory_manager,
-            "load_conversation_state",
-            new_callable=Mock,
+            mock_chef_agent.graph,
+            "ainvoke",
+            new_callable=AsyncMock,
             side_effect=Exception("Memory load error"),
-        ):
+        ) as mock_ainvoke:
             request = ChatRequest(
                 thread_id="test-123", message="Hello", language="en"
             )
 
             response = await mock_chef_agent.process_request(request)
 
-            # Should handle memory error gracefully
-            assert isinstance(response, ChatResponse)
-            assert response.thread_id == "test-123"
+        # Should handle memory error gracefully
+        assert mock_ainvoke.await_count == 1
+        assert isinstance(response, ChatResponse)
+        assert response.thread_id == "test-123"
+        assert "memory load error" in response.message.lower()
@@ -7,6 +7,7 @@ import pytest
 from agent import ChefAgentGraph
 from agent.models import ChatRequest
 from config import settings
+from tests.base_test import CLEAR_DATA_SCRIPT
 
 
 class TestAgentMessageProcessing:
@@ -23,10 +24,7 @@ class TestAgentMessageProcessing:
         from adapters.db.database import Database
 
         db = Database()
-        db.execute_update("DELETE FROM shopping_lists")
-        db.execute_update("DELETE FROM recipe_ingredients")
-        db.execute_update("DELETE FROM recipe_tags")
-        db.execute_update("DELETE FROM recipes")
+        db.execute_script(CLEAR_DATA_SCRIPT)
 
         # Use fallback mode (no MCP client) for testing
         self.agent = ChefAgentGraph(
@@ -295,6 +295,7 @@ class TestRootEndpoints:
         assert data["status"] in ["connected", "error"]
 
 
+@pytest.mark.xdist_group(name="ratelimit")
 class TestRateLimiting:
     """Test cases for rate limiting functionality."""
 
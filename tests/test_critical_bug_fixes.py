@@ -20,6 +20,7 @@ from domain.entities import (
     ShoppingList,
 )
 from domain.meal_plan_generator import MealPlanGenerator
+from tests.base_test import CLEAR_DATA_SCRIPT
 
 
 class TestSQLInjectionPrevention:
@@ -131,10 +132,7 @@ class TestEmptyRecipeHandling:
         from agent import ChefAgentGraph
 
         db = Database()
-        db.execute_update("DELETE FROM shopping_lists")
-        db.execute_update("DELETE FROM recipe_ingredients")
-        db.execute_update("DELETE FROM recipe_tags")
-        db.execute_update("DELETE FROM recipes")
+        db.execute_script(CLEAR_DATA_SCRIPT)
         db.close()
 
         # Create agent in fallback mode (no MCP client)
@@ -178,9 +176,9 @@ class TestDaysValidation:
         ]
 
         # Test valid days count
-        meal_plan, _ = MealPlanGenerator.generate_meal_plan(
+        meal_plan = MealPlanGenerator.generate_meal_plan(
             recipes=recipes, diet_goal="vegetarian", days_count=5
-        )
+        ).meal_plan
         assert meal_plan.total_days == 5
 
         # Test invalid days count - too low
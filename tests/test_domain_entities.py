@@ -2,6 +2,8 @@
 Tests for domain entities.
 """
 
+import pytest
+
 from domain.entities import (
     DietType,
     Ingredient,
@@ -47,6 +49,28 @@ def test_recipe_creation():
     assert not recipe.has_tag("dinner")
 
 
+def test_recipe_diet_type_from_string():
+    """Test that diet type strings are converted to DietType members."""
+    recipe = Recipe(id=1, title="Salad", diet_type="Vegan")
+    assert recipe.diet_type is DietType.VEGAN
+
+    with pytest.raises(ValueError, match="invalid diet_type"):
+        Recipe(id=1, title="Salad", diet_type="carnivore")
+
+
+def test_recipe_and_ingredient_use_slots():
+    """Test that recipes and ingredients carry no per-instance __dict__."""
+    ingredient = Ingredient(name="flour", quantity="2", unit="cups")
+    recipe = Recipe(id=1, title="Pancakes", ingredients=[ingredient])
+
+    assert not hasattr(ingredient, "__dict__")
+    assert not hasattr(recipe, "__dict__")
+
+    # Recipes stay mutable so repositories can assign ids on save
+    recipe.id = 2
+    assert recipe.id == 2
+
+
 def test_shopping_list_operations():
     """Test shopping list operations."""
     shopping_list = ShoppingList()
@@ -100,6 +124,108 @@ def test_meal_plan_creation():
     assert shopping_list.items[1].name == "eggs"
 
 
+def test_meal_plan_shopping_list_cache():
+    """Test that cached shopping lists are fresh and follow recipe swaps."""
+    recipe = Recipe(
+        id=1,
+        title="Pancakes",
+        ingredients=[Ingredient(name="flour", quantity="2", unit="cups")],
+    )
+    meal = Meal(name="breakfast", recipe=recipe)
+    meal_plan = MealPlan(days=[MenuDay(day_number=1, meals=[meal])])
+
+    first = meal_plan.get_shopping_list()
+    first.items[0].purchased = True
+    second = meal_plan.get_shopping_list()
+
+    # Callers get independent lists with the same categorized items
+    assert second is not first
+    assert second.items[0].purchased is False
+    assert second.items[0].category == first.items[0].category
+
+    # Replacing a recipe or adding ingredients rebuilds the list
+    meal.recipe = Recipe(
+        id=2,
+        title="Omelette",
+        ingredients=[Ingredient(name="eggs", quantity="3", unit="pieces")],
+    )
+    assert [i.name for i in meal_plan.get_shopping_list().items] == ["eggs"]
+
+    meal.recipe.ingredients.append(
+        Ingredient(name="milk", quantity="1", unit="cup")
+    )
+    assert [i.name for i in meal_plan.get_shopping_list().items] == [
+        "eggs",
+        "milk",
+    ]
+
+    # Editing an ingredient in place also rebuilds the list
+    meal.recipe.ingredients[0].quantity = "4"
+    meal.recipe.ingredients[1].name = "oat milk"
+    assert [
+        (i.name, i.quantity) for i in meal_plan.get_shopping_list().items
+    ] == [("eggs", "4"), ("oat milk", "1")]
+
+
+def test_meal_plan_shopping_list_merges_ingredients():
+    """Test that repeated ingredients are merged by name and unit."""
+    pancakes = Recipe(
+        id=1,
+        title="Pancakes",
+        ingredients=[
+            Ingredient(name="flour", quantity="2", unit="cups"),
+            Ingredient(name="salt", quantity="to taste", unit=""),
+        ],
+    )
+    bread = Recipe(
+        id=2,
+        title="Bread",
+        ingredients=[
+            Ingredient(name="flour", quantity="1.5", unit="cups"),
+            Ingredient(name="flour", quantity="100", unit="g"),
+            Ingredient(name="salt", quantity="1", unit=""),
+        ],
+    )
+    meal_plan = MealPlan(
+        days=[
+            MenuDay(
+                day_number=1,
+                meals=[
+                    Meal(name="breakfast", recipe=pancakes),
+                    Meal(name="lunch", recipe=bread),
+                ],
+            )
+        ]
+    )
+
+    items = meal_plan.get_shopping_list().items
+
+    assert [(i.name, i.quantity, i.unit) for i in items] == [
+        ("flour", "3.5", "cups"),
+        ("salt", "to taste + 1", ""),
+        ("flour", "100", "g"),
+    ]
+
+
+def test_meal_plan_shopping_list_merges_missing_quantities():
+    """Test that a None quantity is listed instead of crashing the merge."""
+    recipe = Recipe(
+        id=1,
+        title="Salad",
+        ingredients=[
+            Ingredient(name="lettuce", quantity=None, unit="head"),
+            Ingredient(name="lettuce", quantity="1", unit="head"),
+        ],
+    )
+    meal_plan = MealPlan(
+        days=[MenuDay(day_number=1, meals=[Meal(name="lunch", recipe=recipe)])]
+    )
+
+    items = meal_plan.get_shopping_list().items
+
+    assert [(i.name, i.quantity) for i in items] == [("lettuce", "None + 1")]
+
+
 def test_diet_type_enum():
     """Test diet type enum values."""
     assert DietType.LOW_CARB.value == "low-carb"
@@ -9,6 +9,7 @@ import pytest
 from adapters.mcp.client import ChefAgentMCPClient
 from agent import ChefAgentGraph
 from agent.models import AgentState, ConversationState
+from tests.base_test import CLEAR_DATA_SCRIPT
 
 
 class TestInvalidDaysInputHandling:
@@ -403,10 +404,7 @@ class TestEmptyRecipesHandling:
         from adapters.db.database import Database
 
         db = Database()
-        db.execute_update("DELETE FROM shopping_lists")
-        db.execute_update("DELETE FROM recipe_ingredients")
-        db.execute_update("DELETE FROM recipe_tags")
-        db.execute_update("DELETE FROM recipes")
+        db.execute_script(CLEAR_DATA_SCRIPT)
 
         return ChefAgentGraph(
             llm_provider="groq",
@@ -8,35 +8,40 @@ when parsing ingredients in _row_to_recipe.
 import json
 from unittest.mock import Mock
 
+import pytest
+
 from adapters.db.recipe_repository import SQLiteRecipeRepository
 
+_ROW_TEMPLATE = {
+    "id": 1,
+    "title": "Test Recipe",
+    "description": "Test Description",
+    "instructions": "Test Instructions",
+    "prep_time_minutes": 30,
+    "cook_time_minutes": 45,
+    "servings": 4,
+    "difficulty": "medium",
+    "diet_type": "vegetarian",
+    "user_id": "test_user",
+    "created_at": "2024-01-01 00:00:00",
+    "updated_at": "2024-01-01 00:00:00",
+}
+
 
 class TestJsonErrorHandling:
     """Test JSON error handling in recipe repository."""
 
-    def test_empty_string_ingredients(self, temp_database):
-        """Test that empty string ingredients are handled properly."""
-        repo = SQLiteRecipeRepository(temp_database)
+    @pytest.fixture(scope="class")
+    def repo(self, class_temp_database):
+        """Recipe repository shared across tests; rows are never written."""
+        return SQLiteRecipeRepository(class_temp_database)
 
+    def test_empty_string_ingredients(self, repo):
+        """Test that empty string ingredients are handled properly."""
         # Create a mock row with empty string ingredients
         mock_row = Mock()
-        mock_row.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "id": 1,
-                "title": "Test Recipe",
-                "description": "Test Description",
-                "instructions": "Test Instructions",
-                "prep_time_minutes": 30,
-                "cook_time_minutes": 45,
-                "servings": 4,
-                "difficulty": "medium",
-                "diet_type": "vegetarian",
-                "user_id": "test_user",
-                "created_at": "2024-01-01 00:00:00",
-                "updated_at": "2024-01-01 00:00:00",
-                "ingredients": "",  # Empty string
-            }[key]
-        )
+        row_data = {**_ROW_TEMPLATE, "ingredients": ""}  # Empty string
+        mock_row.__getitem__ = Mock(side_effect=row_data.__getitem__)
 
         # This should not raise an exception
         recipe = repo._row_to_recipe(mock_row)
@@ -46,29 +51,12 @@ class TestJsonErrorHandling:
         assert recipe.title == "Test Recipe"
         assert recipe.ingredients == []
 
-    def test_none_ingredients(self, temp_database):
+    def test_none_ingredients(self, repo):
         """Test that None ingredients are handled properly."""
-        repo = SQLiteRecipeRepository(temp_database)
-
         # Create a mock row with None ingredients
         mock_row = Mock()
-        mock_row.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "id": 1,
-                "title": "Test Recipe",
-                "description": "Test Description",
-                "instructions": "Test Instructions",
-                "prep_time_minutes": 30,
-                "cook_time_minutes": 45,
-                "servings": 4,
-                "difficulty": "medium",
-                "diet_type": "vegetarian",
-                "user_id": "test_user",
-                "created_at": "2024-01-01 00:00:00",
-                "updated_at": "2024-01-01 00:00:00",
-                "ingredients": None,  # None value
-            }[key]
-        )
+        row_data = {**_ROW_TEMPLATE, "ingredients": None}  # None value
+        mock_row.__getitem__ = Mock(side_effect=row_data.__getitem__)
 
         # This should not raise an exception
         recipe = repo._row_to_recipe(mock_row)
@@ -78,29 +66,13 @@ class TestJsonErrorHandling:
         assert recipe.title == "Test Recipe"
         assert recipe.ingredients == []
 
-    def test_malformed_json_ingredients(self, temp_database):
+    def test_malformed_json_ingredients(self, repo):
         """Test that malformed JSON ingredients are handled properly."""
-        repo = SQLiteRecipeRepository(temp_database)
-
         # Create a mock row with malformed JSON
         mock_row = Mock()
-        mock_row.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "id": 1,
-                "title": "Test Recipe",
-                "description": "Test Description",
-                "instructions": "Test Instructions",
-                "prep_time_minutes": 30,
-                "cook_time_minutes": 45,
-                "servings": 4,
-                "difficulty": "medium",
-                "diet_type": "vegetarian",
-                "user_id": "test_user",
-                "created_at": "2024-01-01 00:00:00",
-                "updated_at": "2024-01-01 00:00:00",
-                "ingredients": '{"invalid": json}',  # Malformed JSON
-            }[key]
-        )
+        # Malformed JSON
+        row_data = {**_ROW_TEMPLATE, "ingredients": '{"invalid": json}'}
+        mock_row.__getitem__ = Mock(side_effect=row_data.__getitem__)
 
         # This should not raise an exception
         recipe = repo._row_to_recipe(mock_row)
@@ -110,10 +82,8 @@ class TestJsonErrorHandling:
         assert recipe.title == "Test Recipe"
         assert recipe.ingredients == []
 
-    def test_valid_json_ingredients(self, temp_database):
+    def test_valid_json_ingredients(self, repo):
         """Test that valid JSON ingredients are parsed correctly."""
-        repo = SQLiteRecipeRepository(temp_database)
-
         # Create valid JSON ingredients
         valid_ingredients = [
             {
@@ -133,23 +103,8 @@ class TestJsonErrorHandling:
 
         # Create a mock row with valid JSON ingredients
         mock_row = Mock()
-        mock_row.__getitem__ = Mock(
-            side_effect=lambda key: {
-                "id": 1,
-                "title": "Test Recipe",
-                "description": "Test Description",
-                "instructions": "Test Instructions",
-                "prep_time_minutes": 30,
-                "cook_time_minutes": 45,
-                "servings": 4,
-                "difficulty": "medium",
-                "diet_type": "vegetarian",
-                "user_id": "test_user",
-                "created_at": "2024-01-01 00:00:00",
-                "updated_at": "2024-01-01 00:00:00",
-                "ingredients": ingredients_json,
-            }[key]
-        )
+        row_data = {**_ROW_TEMPLATE, "ingredients": ingredients_json}
+        mock_row.__getitem__ = Mock(side_effect=row_data.__getitem__)
 
         # This should not raise an exception
         recipe = repo._row_to_recipe(mock_row)
@@ -4,15 +4,24 @@ Tests for LLM adapters.
 This module contains unit tests for the LLM adapter functionality.
 """
 
-from unittest.mock import AsyncMock, Mock, patch
+import re
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from adapters.llm import LLMFactory
+from adapters.llm.base import GuardedRunnable
+from adapters.llm.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
 from adapters.llm.groq_adapter import GroqAdapter
 from adapters.llm.openai_adapter import OpenAIAdapter
 from tests.base_test import BaseLLMTest
 
+_UNSUPPORTED_RE = re.compile("Unsupported LLM provider")
+
 
 class TestLLMFactory:
     """Test cases for LLMFactory."""
@@ -55,8 +64,9 @@ class TestLLMFactory:
 
     def test_create_llm_unsupported_provider(self):
         """Test creating LLM with unsupported provider."""
-        with pytest.raises(ValueError, match="Unsupported LLM provider"):
+        with pytest.raises(ValueError) as exc:
             LLMFactory.create_llm(provider="unsupported", api_key="test-key")
+        assert _UNSUPPORTED_RE.search(str(exc.value))
 
     def test_get_supported_providers(self):
         """Test getting supported providers."""
@@ -80,12 +90,93 @@ class TestLLMFactory:
         assert info["adapter_class"] is None
 
 
-class TestGroqAdapter(BaseLLMTest):
-    """Test cases for GroqAdapter."""
-
-    def test_model_info_structure(self):
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """Test circuit opens after consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_resets_failure_count(self):
+        """Test a success clears earlier failures."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_after_recovery_timeout(self):
+        """Test a trial call is allowed once the timeout has elapsed."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+
+        # A failed trial call reopens the circuit
+        breaker.record_failure()
+        breaker.recovery_timeout = 60
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_allows_single_trial(self):
+        """Test only one trial call is let through while half-open."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        # A successful trial closes the circuit for everyone
+        breaker.record_success()
+        breaker.before_call()
+        breaker.before_call()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_invalid_threshold(self):
+        """Test failure threshold must be positive."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+
+
+class TestAdapter(BaseLLMTest):
+    """Test cases shared by every LLM adapter."""
+
+    @pytest.fixture(
+        params=[
+            (BaseLLMTest.create_mock_groq_adapter, "groq"),
+            (BaseLLMTest.create_mock_openai_adapter, "openai"),
+        ],
+        ids=["groq", "openai"],
+    )
+    def adapter_case(self, request):
+        """Adapter factory and the provider name it should report."""
+        return request.param
+
+    @pytest.fixture
+    def adapter(self, adapter_case):
+        """Adapter under test with a mocked underlying chat model."""
+        adapter_factory, _ = adapter_case
+        return adapter_factory(self)
+
+    @pytest.fixture
+    def expected_provider(self, adapter_case):
+        """Provider name reported by the adapter under test."""
+        _, provider = adapter_case
+        return provider
+
+    def test_model_info_structure(self, adapter, expected_provider):
         """Test model info returns expected structure."""
-        adapter = self.create_mock_groq_adapter()
         info = adapter.get_model_info()
 
         assert isinstance(info, dict)
@@ -94,15 +185,12 @@ class TestGroqAdapter(BaseLLMTest):
         assert "supports_streaming" in info
         assert "temperature" in info
         assert "max_tokens" in info
-        assert info["provider"] == "groq"
+        assert info["provider"] == expected_provider
         assert info["supports_tools"] is True
         assert info["supports_streaming"] is True
 
-    def test_estimate_tokens(self):
+    def test_estimate_tokens(self, adapter):
         """Test token estimation returns reasonable values."""
-        adapter = self.create_mock_groq_adapter()
-
-        assert adapter.get_model_info()["provider"] == "groq"
         test_cases = [
             ("", 0),  # Empty string
             ("a", 0),  # Single character (len=1, 1//4=0)
@@ -128,12 +216,10 @@ class TestGroqAdapter(BaseLLMTest):
                 tokens == expected
             ), f"Expected {expected} tokens for '{text}', got {tokens}"
 
-    @pytest.mark.asyncio
-    async def test_ainvoke(self):
+    async def test_ainvoke(self, adapter):
         """Test async invoke."""
-        adapter = self.create_mock_groq_adapter()
-        mock_messages = [Mock()]
-        mock_response = Mock()
+        mock_messages = [object()]
+        mock_response = object()
 
         adapter._llm.ainvoke = AsyncMock(return_value=mock_response)
         result = await adapter.ainvoke(mock_messages)
@@ -141,11 +227,10 @@ class TestGroqAdapter(BaseLLMTest):
         assert result == mock_response
         adapter._llm.ainvoke.assert_called_once_with(mock_messages)
 
-    def test_invoke(self):
+    def test_invoke(self, adapter):
         """Test sync invoke."""
-        adapter = self.create_mock_groq_adapter()
-        mock_messages = [Mock()]
-        mock_response = Mock()
+        mock_messages = [object()]
+        mock_response = object()
 
         adapter._llm.invoke.return_value = mock_response
         result = adapter.invoke(mock_messages)
@@ -153,140 +238,78 @@ class TestGroqAdapter(BaseLLMTest):
         assert result == mock_response
         adapter._llm.invoke.assert_called_once_with(mock_messages)
 
-    def test_bind_tools(self):
+    def test_bind_tools(self, adapter):
         """Test binding tools."""
-        adapter = self.create_mock_groq_adapter()
-        mock_tools = [Mock()]
-        mock_response = Mock()
+        mock_tools = [object()]
+        mock_response = object()
 
         adapter._llm.bind_tools.return_value = mock_response
         result = adapter.bind_tools(mock_tools)
 
-        assert result == mock_response
+        assert isinstance(result, GuardedRunnable)
+        assert result.runnable is mock_response
         adapter._llm.bind_tools.assert_called_once_with(mock_tools)
 
-    @pytest.mark.asyncio
-    async def test_ainvoke_failure(self):
+    async def test_bound_tools_share_circuit_breaker(self, adapter):
+        """Test tool-bound calls open the breaker and then fast-fail."""
+        mock_messages = [object()]
+        bound = AsyncMock()
+        bound.ainvoke.side_effect = Exception("API Error")
+        adapter._llm.bind_tools.return_value = bound
+        adapter._circuit_breaker = CircuitBreaker(
+            failure_threshold=2, recovery_timeout=60
+        )
+        llm_with_tools = adapter.bind_tools([object()])
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="API Error"):
+                await llm_with_tools.ainvoke(mock_messages)
+        assert adapter._circuit_breaker.state is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            await llm_with_tools.ainvoke(mock_messages)
+        assert bound.ainvoke.await_count == 2
+
+        # The adapter's own calls are rejected by the same breaker
+        with pytest.raises(CircuitOpenError):
+            await adapter.ainvoke(mock_messages)
+
+    async def test_ainvoke_failure(self, adapter):
         """Test async invoke failure handling."""
-        adapter = self.create_mock_groq_adapter()
-        mock_messages = [Mock()]
+        mock_messages = [object()]
 
         adapter._llm.ainvoke.side_effect = Exception("API Error")
 
         with pytest.raises(Exception, match="API Error"):
             await adapter.ainvoke(mock_messages)
 
-    def test_invoke_failure(self):
-        """Test sync invoke failure handling."""
-        adapter = self.create_mock_groq_adapter()
-        mock_messages = [Mock()]
-
-        adapter._llm.invoke.side_effect = Exception("API Error")
-
-        with pytest.raises(Exception, match="API Error"):
-            adapter.invoke(mock_messages)
-
-
-class TestOpenAIAdapter(BaseLLMTest):
-    """Test cases for OpenAIAdapter."""
-
-    def test_model_info_structure(self):
-        """Test model info returns expected structure."""
-        adapter = self.create_mock_openai_adapter()
-        info = adapter.get_model_info()
-
-        assert isinstance(info, dict)
-        assert "provider" in info
-        assert "supports_tools" in info
-        assert "supports_streaming" in info
-        assert "temperature" in info
-        assert "max_tokens" in info
-        assert info["provider"] == "openai"
-        assert info["supports_tools"] is True
-        assert info["supports_streaming"] is True
-
-    def test_estimate_tokens(self):
-        """Test token estimation returns reasonable values."""
-        adapter = self.create_mock_openai_adapter()
+    async def test_ainvoke_circuit_breaker(self, adapter):
+        """Test async calls open the circuit and then fast-fail."""
+        mock_messages = [object()]
+        adapter._circuit_breaker = CircuitBreaker(
+            failure_threshold=2, recovery_timeout=60
+        )
+        adapter._llm.ainvoke = AsyncMock(side_effect=Exception("API Error"))
 
-        assert adapter.get_model_info()["provider"] == "openai"
-        test_cases = [
-            ("", 0),  # Empty string
-            ("a", 0),  # Single character (len=1, 1//4=0)
-            ("abc", 0),  # 3 chars (3//4=0)
-            ("abcd", 1),  # 4 chars (4//4=1)
-            ("Hello world", 2),  # 11 chars (11//4=2)
-            (
-                "This is a longer text with more content to test estimation",
-                14,
-            ),  # 58 chars (58//4=14)
-        ]
+        for _ in range(2):
+            with pytest.raises(Exception, match="API Error"):
+                await adapter.ainvoke(mock_messages)
+        assert adapter._circuit_breaker.state is CircuitState.OPEN
 
-        for text, expected in test_cases:
-            tokens = adapter.estimate_tokens(text)
-            # Test that estimation is reasonable (not negative, not too high)
-            assert (
-                tokens >= 0
-            ), f"Token count should be non-negative for '{text}'"
-            assert tokens <= len(
-                text
-            ), f"Token count should not exceed text length for '{text}'"
-            assert (
-                tokens == expected
-            ), f"Expected {expected} tokens for '{text}', got {tokens}"
-
-    @pytest.mark.asyncio
-    async def test_ainvoke(self):
-        """Test async invoke."""
-        adapter = self.create_mock_openai_adapter()
-        mock_messages = [Mock()]
-        mock_response = Mock()
-
-        adapter._llm.ainvoke = AsyncMock(return_value=mock_response)
-        result = await adapter.ainvoke(mock_messages)
-
-        assert result == mock_response
-        adapter._llm.ainvoke.assert_called_once_with(mock_messages)
-
-    def test_invoke(self):
-        """Test sync invoke."""
-        adapter = self.create_mock_openai_adapter()
-        mock_messages = [Mock()]
-        mock_response = Mock()
-
-        adapter._llm.invoke.return_value = mock_response
-        result = adapter.invoke(mock_messages)
-
-        assert result == mock_response
-        adapter._llm.invoke.assert_called_once_with(mock_messages)
-
-    def test_bind_tools(self):
-        """Test binding tools."""
-        adapter = self.create_mock_openai_adapter()
-        mock_tools = [Mock()]
-        mock_response = Mock()
-
-        adapter._llm.bind_tools.return_value = mock_response
-        result = adapter.bind_tools(mock_tools)
-
-        assert result == mock_response
-        adapter._llm.bind_tools.assert_called_once_with(mock_tools)
-
-    @pytest.mark.asyncio
-    async def test_ainvoke_failure(self):
-        """Test async invoke failure handling."""
-        adapter = self.create_mock_openai_adapter()
-        mock_messages = [Mock()]
-
-        adapter._llm.ainvoke.side_effect = Exception("API Error")
-
-        with pytest.raises(Exception, match="API Error"):
+        with pytest.raises(CircuitOpenError):
             await adapter.ainvoke(mock_messages)
+        assert adapter._llm.ainvoke.await_count == 2
+
+        # Once the timeout elapses a successful trial closes the circuit
+        adapter._circuit_breaker.recovery_timeout = 0
+        adapter._llm.ainvoke.side_effect = None
+        adapter._llm.ainvoke.return_value = "ok"
+        assert await adapter.ainvoke(mock_messages) == "ok"
+        assert adapter._circuit_breaker.state is CircuitState.CLOSED
 
-    def test_invoke_failure(self):
+    def test_invoke_failure(self, adapter):
         """Test sync invoke failure handling."""
-        adapter = self.create_mock_openai_adapter()
-        mock_messages = [Mock()]
+        mock_messages = [object()]
 
         adapter._llm.invoke.side_effect = Exception("API Error")
 
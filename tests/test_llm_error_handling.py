@@ -5,315 +5,394 @@ This module contains comprehensive tests for handling various LLM errors,
 including API failures, timeouts, rate limits, and recovery mechanisms.
 """
 
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import re
+from collections import namedtuple
+from functools import lru_cache, partial
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from langchain_core.messages import HumanMessage
 
+from adapters.llm.circuit_breaker import CircuitOpenError, CircuitState
 from adapters.llm.groq_adapter import GroqAdapter
 from adapters.llm.openai_adapter import OpenAIAdapter
 from agent import ChefAgentGraph
 from agent.models import AgentState, ChatRequest, ChatResponse
 
+_LONG_CONTENT = "A" * 10000  # 10KB response
 
-@pytest.mark.llm_errors
-class TestLLMErrorHandling:
-    """Test LLM adapter error handling scenarios."""
+_GROQ = "adapters.llm.groq_adapter.ChatGroq"
+_OPENAI = "adapters.llm.openai_adapter.ChatOpenAI"
 
-    def test_groq_api_rate_limit_error(self):
-        """Test Groq API rate limit error handling."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
+# Precompiled patterns for pytest.raises(match=...)
+_RATE_LIMIT = re.compile("Rate limit exceeded")
+_QUOTA = re.compile("Quota exceeded")
+_TIMEOUT = re.compile("Request timeout")
+_INVALID_KEY = re.compile("Invalid API key")
+_MODEL_NOT_FOUND = re.compile("Model not found")
+_NETWORK = re.compile("Network connection failed")
+_ASYNC_API = re.compile("Async API error")
+_UNSUPPORTED = re.compile("Unsupported LLM provider")
+_TEMPORARY = re.compile("Temporary failure")
+_PERSISTENT = re.compile("Persistent API failure")
+_LOGGED = re.compile("Test error for logging")
 
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
-            # Mock rate limit error
-            mock_groq.return_value.invoke.side_effect = Exception(
-                "Rate limit exceeded"
-            )
 
-            with pytest.raises(Exception, match="Rate limit exceeded"):
-                adapter.invoke([HumanMessage(content="Test message")])
+# Stub chat response; the adapter tests only read .content
+Resp = namedtuple("Resp", ["content"])
 
-    def test_openai_api_quota_exceeded(self):
-        """Test OpenAI API quota exceeded error."""
-        adapter = OpenAIAdapter(api_key="test-key", model="gpt-4")
 
-        with patch("adapters.llm.openai_adapter.ChatOpenAI") as mock_openai:
-            # Mock quota exceeded error
-            mock_openai.return_value.invoke.side_effect = Exception(
-                "Quota exceeded"
-            )
+@lru_cache(maxsize=8)
+def _cached_groq(api_key: str, model: str) -> GroqAdapter:
+    return GroqAdapter(api_key=api_key, model=model)
 
-            with pytest.raises(Exception, match="Quota exceeded"):
-                adapter.invoke([HumanMessage(content="Test message")])
 
-    def test_llm_timeout_error(self):
-        """Test LLM timeout error handling."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
+@lru_cache(maxsize=8)
+def _cached_openai(api_key: str, model: str) -> OpenAIAdapter:
+    return OpenAIAdapter(api_key=api_key, model=model)
 
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
-            # Mock timeout error
-            mock_groq.return_value.invoke.side_effect = TimeoutError(
-                "Request timeout"
-            )
 
-            with pytest.raises(TimeoutError, match="Request timeout"):
-                adapter.invoke([HumanMessage(content="Test message")])
+def _make_groq(
+    api_key: str = "test-key", model: str = "llama-3.1-8b-instant"
+) -> GroqAdapter:
+    """Return a shared Groq adapter without a cached chat model."""
+    adapter = _cached_groq(api_key, model)
+    # The chat model is created lazily under each test's ChatGroq patch
+    adapter.close()
+    return adapter
 
-    def test_llm_invalid_api_key(self):
-        """Test LLM invalid API key error."""
-        adapter = GroqAdapter(
-            api_key="invalid-key", model="llama-3.1-8b-instant"
-        )
 
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
-            # Mock invalid API key error
-            mock_groq.return_value.invoke.side_effect = Exception(
-                "Invalid API key"
-            )
+def _make_openai(
+    api_key: str = "test-key", model: str = "gpt-4"
+) -> OpenAIAdapter:
+    """Return a shared OpenAI adapter without a cached chat model."""
+    adapter = _cached_openai(api_key, model)
+    adapter.close()
+    return adapter
 
-            with pytest.raises(Exception, match="Invalid API key"):
-                adapter.invoke([HumanMessage(content="Test message")])
 
-    def test_llm_model_not_found(self):
-        """Test LLM model not found error."""
-        adapter = GroqAdapter(api_key="test-key", model="nonexistent-model")
+@pytest.fixture
+def no_sdk_clients():
+    """Replace the Groq and OpenAI chat clients with no-op mocks."""
+    with (
+        patch("adapters.llm.groq_adapter.ChatGroq", MagicMock()),
+        patch("adapters.llm.openai_adapter.ChatOpenAI", MagicMock()),
+    ):
+        yield
 
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
-            # Mock model not found error
-            mock_groq.return_value.invoke.side_effect = Exception(
-                "Model not found"
-            )
 
-            with pytest.raises(Exception, match="Model not found"):
-                adapter.invoke([HumanMessage(content="Test message")])
+@pytest.fixture(scope="session")
+def hello_request():
+    """Shared read-only chat request; process_request never mutates it."""
+    return ChatRequest(thread_id="test-123", message="Hello", language="en")
 
-    def test_llm_network_connection_error(self):
-        """Test LLM network connection error."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
 
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
-            # Mock network error
-            mock_groq.return_value.invoke.side_effect = ConnectionError(
-                "Network connection failed"
-            )
+@pytest.fixture
+def patched_graph(mock_chef_agent):
+    """AsyncMock patched over the agent graph's ainvoke for one test.
+
+    process_request reaches the LLM only through the graph, so this is
+    where LLM results and failures surface.
+    """
+    with patch.object(
+        mock_chef_agent.graph, "ainvoke", new_callable=AsyncMock
+    ) as mock_ainvoke:
+        yield mock_ainvoke
+
+
+def _assert_graph_input(mock_ainvoke, request):
+    """Assert the last graph call carried the request's message."""
+    (graph_input,), kwargs = mock_ainvoke.await_args
+    assert graph_input["thread_id"] == request.thread_id
+    assert graph_input["messages"] == [
+        {"role": "user", "content": request.message}
+    ]
+    assert kwargs["config"]["configurable"]["thread_id"] == request.thread_id
 
-            with pytest.raises(
-                ConnectionError, match="Network connection failed"
-            ):
+
+@pytest.fixture
+def groq_adapter():
+    """Shared Groq adapter for the default test key and model."""
+    return _make_groq()
+
+
+@pytest.mark.llm_errors
+class TestLLMErrorHandling:
+    """Test LLM adapter error handling scenarios."""
+
+    @pytest.mark.parametrize(
+        "adapter_factory,patch_target,exc_cls,message,pattern",
+        [
+            (_make_groq, _GROQ, Exception, "Rate limit exceeded", _RATE_LIMIT),
+            (_make_openai, _OPENAI, Exception, "Quota exceeded", _QUOTA),
+            (_make_groq, _GROQ, TimeoutError, "Request timeout", _TIMEOUT),
+            (
+                partial(_make_groq, api_key="invalid-key"),
+                _GROQ,
+                Exception,
+                "Invalid API key",
+                _INVALID_KEY,
+            ),
+            (
+                partial(_make_groq, model="nonexistent-model"),
+                _GROQ,
+                Exception,
+                "Model not found",
+                _MODEL_NOT_FOUND,
+            ),
+            (
+                _make_groq,
+                _GROQ,
+                ConnectionError,
+                "Network connection failed",
+                _NETWORK,
+            ),
+        ],
+        ids=[
+            "rate_limit",
+            "quota_exceeded",
+            "timeout",
+            "invalid_api_key",
+            "model_not_found",
+            "network_error",
+        ],
+    )
+    def test_adapter_errors(
+        self, adapter_factory, patch_target, exc_cls, message, pattern
+    ):
+        """Test provider errors propagate out of adapter.invoke."""
+        adapter = adapter_factory()
+
+        with patch(patch_target, spec=True) as mock_client:
+            mock_client.return_value.invoke.side_effect = exc_cls(message)
+
+            with pytest.raises(exc_cls, match=pattern):
                 adapter.invoke([HumanMessage(content="Test message")])
 
     @pytest.mark.asyncio
-    async def test_llm_async_error_handling(self):
+    async def test_llm_async_error_handling(self, groq_adapter):
         """Test async LLM error handling."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock async error
             mock_groq.return_value.ainvoke = AsyncMock(
                 side_effect=Exception("Async API error")
             )
 
-            with pytest.raises(Exception, match="Async API error"):
-                await adapter.ainvoke([HumanMessage(content="Test message")])
+            with pytest.raises(Exception, match=_ASYNC_API):
+                await groq_adapter.ainvoke(
+                    [HumanMessage(content="Test message")]
+                )
 
-    def test_llm_invalid_input_format(self):
+    def test_llm_invalid_input_format(self, groq_adapter):
         """Test LLM invalid input format error."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
         # Test with invalid message format
         with pytest.raises(ValueError):
-            adapter.invoke([])  # Empty messages
+            groq_adapter.invoke([])  # Empty messages
 
         with pytest.raises(ValueError):
-            adapter.invoke(None)  # None messages
+            groq_adapter.invoke(None)  # None messages
 
-    def test_llm_response_parsing_error(self):
+    def test_llm_response_parsing_error(self, groq_adapter):
         """Test LLM response parsing error."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock invalid response format
-            mock_response = Mock()
-            mock_response.content = None  # Invalid content
+            mock_response = Resp(None)  # Invalid content
             mock_groq.return_value.invoke.return_value = mock_response
 
             # Should handle gracefully
-            result = adapter.invoke([HumanMessage(content="Test message")])
+            result = groq_adapter.invoke(
+                [HumanMessage(content="Test message")]
+            )
             assert result is not None
 
-    def test_llm_empty_response_handling(self):
+    def test_llm_empty_response_handling(self, groq_adapter):
         """Test LLM empty response handling."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock empty response
-            mock_response = Mock()
-            mock_response.content = ""  # Empty content
+            mock_response = Resp("")  # Empty content
             mock_groq.return_value.invoke.return_value = mock_response
 
             # Should handle empty response gracefully
-            result = adapter.invoke([HumanMessage(content="Test message")])
+            result = groq_adapter.invoke(
+                [HumanMessage(content="Test message")]
+            )
             assert result is not None
             assert result.content == ""
 
-    def test_llm_whitespace_only_response(self):
+    def test_llm_whitespace_only_response(self, groq_adapter):
         """Test LLM response with only whitespace."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock whitespace-only response
-            mock_response = Mock()
-            mock_response.content = "   \n\t  "  # Only whitespace
+            mock_response = Resp("   \n\t  ")  # Only whitespace
             mock_groq.return_value.invoke.return_value = mock_response
 
             # Should handle whitespace-only response
-            result = adapter.invoke([HumanMessage(content="Test message")])
+            result = groq_adapter.invoke(
+                [HumanMessage(content="Test message")]
+            )
             assert result is not None
             assert result.content == "   \n\t  "
 
-    def test_llm_null_response_handling(self):
+    def test_llm_null_response_handling(self, groq_adapter):
         """Test LLM null response handling."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock null response
-            mock_response = Mock()
-            mock_response.content = None  # Null content
+            mock_response = Resp(None)  # Null content
             mock_groq.return_value.invoke.return_value = mock_response
 
             # Should handle null response gracefully
-            result = adapter.invoke([HumanMessage(content="Test message")])
+            result = groq_adapter.invoke(
+                [HumanMessage(content="Test message")]
+            )
             assert result is not None
             assert result.content is None
 
     @pytest.mark.asyncio
-    async def test_llm_async_empty_response_handling(self):
+    async def test_llm_async_empty_response_handling(self, groq_adapter):
         """Test async LLM empty response handling."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock empty async response
-            mock_response = Mock()
-            mock_response.content = ""
+            mock_response = Resp("")
             mock_groq.return_value.ainvoke = AsyncMock(
                 return_value=mock_response
             )
 
             # Should handle empty async response gracefully
-            result = await adapter.ainvoke(
+            result = await groq_adapter.ainvoke(
                 [HumanMessage(content="Test message")]
             )
             assert result is not None
             assert result.content == ""
 
-    def test_llm_response_with_special_characters(self):
+    def test_llm_response_with_special_characters(self, groq_adapter):
         """Test LLM response with special characters."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock response with special characters
-            mock_response = Mock()
-            mock_response.content = "Response with special chars: \x00\x01\x02"
+            mock_response = Resp("Response with special chars: \x00\x01\x02")
             mock_groq.return_value.invoke.return_value = mock_response
 
             # Should handle special characters
-            result = adapter.invoke([HumanMessage(content="Test message")])
+            result = groq_adapter.invoke(
+                [HumanMessage(content="Test message")]
+            )
             assert result is not None
             assert "special chars" in result.content
 
-    def test_llm_very_long_response(self):
+    def test_llm_very_long_response(self, groq_adapter):
         """Test LLM very long response handling."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock very long response
-            long_content = "A" * 10000  # 10KB response
-            mock_response = Mock()
-            mock_response.content = long_content
+            mock_response = Resp(_LONG_CONTENT)
             mock_groq.return_value.invoke.return_value = mock_response
 
             # Should handle long response
-            result = adapter.invoke([HumanMessage(content="Test message")])
+            result = groq_adapter.invoke(
+                [HumanMessage(content="Test message")]
+            )
             assert result is not None
             assert len(result.content) == 10000
-            assert result.content == long_content
+            assert result.content == _LONG_CONTENT
 
 
 @pytest.mark.llm_errors
 class TestAgentLLMErrorHandling:
     """Test agent-level LLM error handling."""
 
-    @pytest.mark.asyncio
-    async def test_agent_llm_failure_recovery(self, mock_chef_agent):
-        """Test agent recovery from LLM failures."""
-        # Mock LLM to fail
-        with patch.object(
-            mock_chef_agent.llm,
-            "ainvoke",
-            new_callable=Mock,
-            side_effect=Exception("LLM API Error"),
-        ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello", language="en"
-            )
-
-            response = await mock_chef_agent.process_request(request)
-
-            # Should handle error gracefully
-            assert isinstance(response, ChatResponse)
-            assert response.thread_id == "test-123"
-            assert "error" in response.message.lower()
+    @pytest.mark.parametrize(
+        "side_effect,expected_substr",
+        [
+            (Exception("LLM API Error"), "llm api error"),
+            (TimeoutError("Request timeout"), "request timeout"),
+            (Exception("Rate limit exceeded"), "rate limit exceeded"),
+            (
+                Exception("LLM returned null response"),
+                "llm returned null response",
+            ),
+        ],
+        ids=["failure", "timeout", "rate_limit", "null_response"],
+    )
+    async def test_agent_error_matrix(
+        self, mock_chef_agent, side_effect, expected_substr
+    ):
+        """Test agent turns LLM failures into error responses."""
+        requests = [
+            ChatRequest(thread_id=f"test-{i}", message="Hello", language="en")
+            for i in range(3)
+        ]
 
-    @pytest.mark.asyncio
-    async def test_agent_llm_timeout_handling(self, mock_chef_agent):
-        """Test agent handling of LLM timeouts."""
-        # Mock LLM to timeout
+        # process_request awaits the graph, which is where LLM errors surface
         with patch.object(
-            mock_chef_agent.llm,
+            mock_chef_agent.graph,
             "ainvoke",
-            new_callable=Mock,
-            side_effect=TimeoutError("Request timeout"),
+            new_callable=AsyncMock,
+            side_effect=side_effect,
         ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello", language="en"
+            responses = await asyncio.gather(
+                *[mock_chef_agent.process_request(r) for r in requests]
             )
 
-            response = await mock_chef_agent.process_request(request)
+        # Should handle every concurrent failure gracefully
+        for request, response in zip(requests, responses):
+            assert response.thread_id == request.thread_id
+            assert "error" in response.message.lower()
+            assert expected_substr in response.message.lower()
 
-            # Should handle timeout gracefully
-            assert isinstance(response, ChatResponse)
-            assert response.thread_id == "test-123"
-            assert (
-                "timeout" in response.message.lower()
-                or "error" in response.message.lower()
-            )
+    @pytest.mark.parametrize(
+        "graph_result",
+        [
+            {
+                "return_value": AgentState(
+                    thread_id="test-123",
+                    messages=[
+                        {"role": "user", "content": "Hello"},
+                        {"role": "assistant", "content": "Hello!"},
+                    ],
+                    language="en",
+                )
+            },
+            {"side_effect": Exception("LLM API Error")},
+        ],
+        ids=["success", "error"],
+    )
+    async def test_process_request_returns_chatresponse(
+        self, mock_chef_agent, hello_request, graph_result
+    ):
+        """Test process_request returns a ChatResponse on every path.
 
-    @pytest.mark.asyncio
-    async def test_agent_llm_rate_limit_handling(self, mock_chef_agent):
-        """Test agent handling of LLM rate limits."""
-        # Mock LLM to hit rate limit
+        The other agent tests rely on this contract instead of repeating
+        the isinstance check.
+        """
         with patch.object(
-            mock_chef_agent.llm,
+            mock_chef_agent.graph,
             "ainvoke",
-            new_callable=Mock,
-            side_effect=Exception("Rate limit exceeded"),
+            new_callable=AsyncMock,
+            **graph_result,
         ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello", language="en"
-            )
+            response = await mock_chef_agent.process_request(hello_request)
 
-            response = await mock_chef_agent.process_request(request)
-
-            # Should handle rate limit gracefully
-            assert isinstance(response, ChatResponse)
-            assert response.thread_id == "test-123"
-            assert (
-                "rate limit" in response.message.lower()
-                or "error" in response.message.lower()
-            )
+        assert isinstance(response, ChatResponse)
 
     @pytest.mark.asyncio
-    async def test_agent_llm_partial_failure(self, mock_chef_agent):
+    async def test_agent_llm_partial_failure(
+        self, mock_chef_agent, hello_request
+    ):
         """Test agent handling of partial LLM failures."""
         # Mock LLM to fail on first call but succeed on retry
         call_count = 0
@@ -340,15 +419,10 @@ class TestAgentLLMErrorHandling:
             new_callable=AsyncMock,
             side_effect=mock_ainvoke,
         ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello", language="en"
-            )
-
             # Agent should handle error gracefully
-            response = await mock_chef_agent.process_request(request)
+            response = await mock_chef_agent.process_request(hello_request)
 
             # Verify response indicates error
-            assert isinstance(response, ChatResponse)
             assert response.thread_id == "test-123"
             assert "error" in response.message.lower()
 
@@ -363,115 +437,76 @@ class TestAgentLLMErrorHandling:
             # Make the mock raise ValueError for unsupported providers
             mock_factory.side_effect = ValueError("Unsupported LLM provider")
 
-            with pytest.raises(ValueError, match="Unsupported LLM provider"):
+            with pytest.raises(ValueError, match=_UNSUPPORTED):
                 ChefAgentGraph("invalid-provider", "test-key", Mock())
 
     @pytest.mark.asyncio
-    async def test_agent_llm_memory_error(self, mock_chef_agent):
+    async def test_agent_llm_memory_error(
+        self, mock_chef_agent, hello_request
+    ):
         """Test agent handling of LLM memory errors."""
-        # Mock memory manager to fail
+        # The checkpointer saves state inside the graph run, so a memory
+        # failure surfaces from graph.ainvoke
         with patch.object(
-            mock_chef_agent.memory_manager,
-            "save_conversation_state",
-            new_callable=Mock,
+            mock_chef_agent.graph,
+            "ainvoke",
+            new_callable=AsyncMock,
             side_effect=Exception("Memory save error"),
-        ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello", language="en"
-            )
-
+        ) as mock_ainvoke:
             # Should handle memory error gracefully
-            response = await mock_chef_agent.process_request(request)
-            assert isinstance(response, ChatResponse)
-            assert response.thread_id == "test-123"
+            response = await mock_chef_agent.process_request(hello_request)
+
+        assert mock_ainvoke.await_count == 1
+        assert response.thread_id == "test-123"
+        assert "memory save error" in response.message.lower()
 
     @pytest.mark.asyncio
-    async def test_agent_llm_empty_response_handling(self, mock_chef_agent):
+    async def test_agent_llm_empty_response_handling(
+        self, mock_chef_agent, hello_request, patched_graph
+    ):
         """Test agent handling of empty LLM responses."""
         # Mock LLM to return empty response
-        with patch.object(
-            mock_chef_agent.llm,
-            "ainvoke",
-            new_callable=AsyncMock,
-            return_value=AgentState(
-                thread_id="test-123",
-                messages=[
-                    {"role": "user", "content": "Hello"},
-                    {"role": "assistant", "content": ""},  # Empty response
-                ],
-                language="en",
-            ),
-        ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello", language="en"
-            )
+        patched_graph.return_value = AgentState(
+            thread_id="test-123",
+            messages=[
+                {"role": "user", "content": "Hello"},
+                {"role": "assistant", "content": ""},  # Empty response
+            ],
+            language="en",
+        )
 
-            response = await mock_chef_agent.process_request(request)
-            assert isinstance(response, ChatResponse)
-            assert response.thread_id == "test-123"
-            # Should handle empty response gracefully
-            assert (
-                response.message == "" or "error" in response.message.lower()
-            )
+        response = await mock_chef_agent.process_request(hello_request)
+        assert patched_graph.await_count == 1
+        _assert_graph_input(patched_graph, hello_request)
+        assert response.thread_id == "test-123"
+        # The empty assistant message is passed through as is
+        assert response.message == ""
 
     @pytest.mark.asyncio
     async def test_agent_llm_whitespace_response_handling(
-        self, mock_chef_agent
+        self, mock_chef_agent, hello_request, patched_graph
     ):
         """Test agent handling of whitespace-only LLM responses."""
         # Mock LLM to return whitespace-only response
-        with patch.object(
-            mock_chef_agent.llm,
-            "ainvoke",
-            new_callable=AsyncMock,
-            return_value=AgentState(
-                thread_id="test-123",
-                messages=[
-                    {"role": "user", "content": "Hello"},
-                    {
-                        "role": "assistant",
-                        "content": "   \n\t  ",
-                    },  # Whitespace only
-                ],
-                language="en",
-            ),
-        ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello", language="en"
-            )
-
-            response = await mock_chef_agent.process_request(request)
-            assert isinstance(response, ChatResponse)
-            assert response.thread_id == "test-123"
-            # Should handle whitespace response
-            assert (
-                response.message.strip() == ""
-                or "error" in response.message.lower()
-            )
-
-    @pytest.mark.asyncio
-    async def test_agent_llm_null_response_handling(self, mock_chef_agent):
-        """Test agent handling of null LLM responses."""
-        # Mock LLM to return null response by raising an exception
-        with patch.object(
-            mock_chef_agent.llm,
-            "ainvoke",
-            new_callable=Mock,
-            side_effect=Exception("LLM returned null response"),
-        ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello", language="en"
-            )
+        patched_graph.return_value = AgentState(
+            thread_id="test-123",
+            messages=[
+                {"role": "user", "content": "Hello"},
+                {"role": "assistant", "content": "   \n\t  "},  # Whitespace
+            ],
+            language="en",
+        )
 
-            response = await mock_chef_agent.process_request(request)
-            assert isinstance(response, ChatResponse)
-            assert response.thread_id == "test-123"
-            # Should handle null response gracefully
-            assert "error" in response.message.lower()
+        response = await mock_chef_agent.process_request(hello_request)
+        assert patched_graph.await_count == 1
+        _assert_graph_input(patched_graph, hello_request)
+        assert response.thread_id == "test-123"
+        # The whitespace-only assistant message is passed through as is
+        assert response.message == "   \n\t  "
 
     @pytest.mark.asyncio
     async def test_agent_llm_special_characters_response(
-        self, mock_chef_agent
+        self, mock_chef_agent, hello_request
     ):
         """Test agent handling of LLM responses with special characters."""
         # Mock LLM to return response with special characters
@@ -493,12 +528,7 @@ class TestAgentLLMErrorHandling:
             new_callable=AsyncMock,
             return_value=mock_state,
         ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello", language="en"
-            )
-
-            response = await mock_chef_agent.process_request(request)
-            assert isinstance(response, ChatResponse)
+            response = await mock_chef_agent.process_request(hello_request)
             assert response.thread_id == "test-123"
             # Should handle special characters
             assert "special chars" in response.message
@@ -508,11 +538,11 @@ class TestAgentLLMErrorHandling:
 class TestLLMRetryMechanisms:
     """Test LLM retry mechanisms and circuit breakers."""
 
-    def test_llm_retry_on_temporary_failure(self):
+    def test_llm_retry_on_temporary_failure(self, groq_adapter):
         """Test LLM retry on temporary failures."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock temporary failure followed by success
             call_count = 0
 
@@ -522,57 +552,86 @@ class TestLLMRetryMechanisms:
                 if call_count <= 2:
                     raise Exception("Temporary failure")
                 else:
-                    return Mock(content="Success")
+                    return Resp("Success")
 
             mock_groq.return_value.invoke.side_effect = mock_invoke
 
             # Should fail on first call (no retry logic implemented)
-            with pytest.raises(Exception, match="Temporary failure"):
-                adapter.invoke([HumanMessage(content="Test message")])
+            with pytest.raises(Exception, match=_TEMPORARY):
+                groq_adapter.invoke([HumanMessage(content="Test message")])
 
             # Verify it was called once (no retry)
             assert call_count == 1
 
-    def test_llm_circuit_breaker_pattern(self):
-        """Test LLM circuit breaker pattern."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+    @pytest.fixture
+    def failing_groq(self, groq_adapter):
+        """Groq adapter whose chat model always fails."""
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock persistent failure
             mock_groq.return_value.invoke.side_effect = Exception(
                 "Persistent API failure"
             )
+            yield groq_adapter, mock_groq.return_value.invoke
 
-            # Multiple calls should all fail
-            for _ in range(5):
-                with pytest.raises(Exception, match="Persistent API failure"):
-                    adapter.invoke([HumanMessage(content="Test message")])
-
-    def test_llm_fallback_provider(self):
-        """Test LLM fallback to different provider."""
-        # This would require implementing fallback logic
-        # For now, just test that we can create different adapters
-        groq_adapter = GroqAdapter(
-            api_key="test-key", model="llama-3.1-8b-instant"
-        )
-        openai_adapter = OpenAIAdapter(api_key="test-key", model="gpt-4")
+    @pytest.mark.parametrize("attempt", range(5))
+    def test_llm_circuit_breaker_pattern(self, failing_groq, attempt):
+        """Test calls reach the API until the failure threshold is hit."""
+        adapter, mock_invoke = failing_groq
+        for _ in range(attempt):
+            adapter._circuit_breaker.record_failure()
 
-        assert groq_adapter.get_model_info()["provider"] == "groq"
-        assert openai_adapter.get_model_info()["provider"] == "openai"
+        with pytest.raises(Exception, match=_PERSISTENT):
+            adapter.invoke([HumanMessage(content="Test message")])
 
-    def test_llm_error_logging(self):
+        assert mock_invoke.call_count == 1
+        expected_state = (
+            CircuitState.OPEN if attempt == 4 else CircuitState.CLOSED
+        )
+        assert adapter._circuit_breaker.state is expected_state
+
+    def test_llm_circuit_breaker_fast_fail(self, failing_groq):
+        """Test open circuit fast-fails without touching the API."""
+        adapter, mock_invoke = failing_groq
+        for _ in range(5):
+            adapter._circuit_breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError):
+            adapter.invoke([HumanMessage(content="Test message")])
+
+        mock_invoke.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "cls,kwargs,expected",
+        [
+            (
+                GroqAdapter,
+                {"api_key": "k", "model": "llama-3.1-8b-instant"},
+                "groq",
+            ),
+            (OpenAIAdapter, {"api_key": "k", "model": "gpt-4"}, "openai"),
+        ],
+        ids=["groq", "openai"],
+    )
+    @pytest.mark.usefixtures("no_sdk_clients")
+    def test_provider_identity(self, cls, kwargs, expected):
+        """Test each fallback candidate reports its own provider."""
+        assert cls(**kwargs).get_model_info()["provider"] == expected
+
+    def test_llm_error_logging(self, groq_adapter):
         """Test LLM error logging."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock error with specific message
             mock_groq.return_value.invoke.side_effect = Exception(
                 "Test error for logging"
             )
 
             # Test that error is raised (logging is handled internally)
-            with pytest.raises(Exception, match="Test error for logging"):
-                adapter.invoke([HumanMessage(content="Test message")])
+            with pytest.raises(Exception, match=_LOGGED):
+                groq_adapter.invoke([HumanMessage(content="Test message")])
 
 
 @pytest.mark.llm_errors
@@ -580,68 +639,61 @@ class TestLLMErrorRecovery:
     """Test LLM error recovery scenarios."""
 
     @pytest.mark.asyncio
-    async def test_agent_recovery_after_llm_failure(self, mock_chef_agent):
+    async def test_agent_recovery_after_llm_failure(
+        self, mock_chef_agent, hello_request, patched_graph
+    ):
         """Test agent recovery after LLM failure."""
         # First call fails
-        with patch.object(
-            mock_chef_agent.llm,
-            "ainvoke",
-            new_callable=Mock,
-            side_effect=Exception("LLM failure"),
-        ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello", language="en"
-            )
+        patched_graph.side_effect = Exception("LLM failure")
 
-            response = await mock_chef_agent.process_request(request)
-            assert "error" in response.message.lower()
+        response = await mock_chef_agent.process_request(hello_request)
+        assert patched_graph.await_count == 1
+        _assert_graph_input(patched_graph, hello_request)
+        assert "llm failure" in response.message.lower()
 
         # Second call succeeds
-        with patch.object(
-            mock_chef_agent.llm,
-            "ainvoke",
-            new_callable=AsyncMock,
-            return_value=AgentState(
-                thread_id="test-123",
-                messages=[
-                    {"role": "user", "content": "Hello"},
-                    {"role": "assistant", "content": "Hi!"},
-                ],
-                language="en",
-            ),
-        ):
-            request = ChatRequest(
-                thread_id="test-123", message="Hello again", language="en"
-            )
+        patched_graph.side_effect = None
+        patched_graph.return_value = AgentState(
+            thread_id="test-123",
+            messages=[
+                {"role": "user", "content": "Hello"},
+                {"role": "assistant", "content": "Hi!"},
+            ],
+            language="en",
+        )
+        request = ChatRequest(
+            thread_id="test-123", message="Hello again", language="en"
+        )
 
-            response = await mock_chef_agent.process_request(request)
-            assert isinstance(response, ChatResponse)
-            assert response.thread_id == "test-123"
+        response = await mock_chef_agent.process_request(request)
+        assert patched_graph.await_count == 2
+        _assert_graph_input(patched_graph, request)
+        assert response.thread_id == "test-123"
+        assert response.message == "Hi!"
 
-    def test_llm_error_state_preservation(self):
+    def test_llm_error_state_preservation(self, groq_adapter):
         """Test that LLM errors don't corrupt agent state."""
         # This would require more complex state management testing
         # For now, just verify that adapters maintain their state
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
 
         # Verify adapter state is preserved
-        assert adapter.api_key == "test-key"
-        assert adapter.model == "llama-3.1-8b-instant"
-        assert adapter.temperature == 0.7
-        assert adapter.max_tokens == 2048
+        assert groq_adapter.api_key == "test-key"
+        assert groq_adapter.model == "llama-3.1-8b-instant"
+        assert groq_adapter.temperature == 0.7
+        assert groq_adapter.max_tokens == 2048
 
-    def test_llm_error_metrics_collection(self):
+    def test_llm_error_metrics_collection(self, groq_adapter):
         """Test LLM error metrics collection."""
-        adapter = GroqAdapter(api_key="test-key", model="llama-3.1-8b-instant")
-
-        with patch("adapters.llm.groq_adapter.ChatGroq") as mock_groq:
+        with patch(
+            "adapters.llm.groq_adapter.ChatGroq", spec=True
+        ) as mock_groq:
             # Mock error
             mock_groq.return_value.invoke.side_effect = Exception("Test error")
 
             # Track error count
             error_count = 0
             try:
-                adapter.invoke([HumanMessage(content="Test message")])
+                groq_adapter.invoke([HumanMessage(content="Test message")])
             except Exception:
                 error_count += 1
 
@@ -1,16 +1,10 @@
-from fastapi.testclient import TestClient
+import asyncio
 
-from main import app
+import pytest
 
-client = TestClient(app)
-
-
-def test_read_root():
-    """Test the root endpoint returns proper API information."""
-    response = client.get("/")
-    assert response.status_code == 200
-    data = response.json()
 
+def _check_root(data):
+    """Root endpoint returns proper API information."""
     # Verify API information structure
     assert data["message"] == "Chef Agent API"
     assert data["version"] == "1.0.0"
@@ -28,13 +22,8 @@ def test_read_root():
     assert data["shopping"] == "/api/v1/shopping/"
 
 
-def test_database_status():
-    """Test database status endpoint."""
-    response = client.get("/db/status")
-    assert response.status_code == 200
-    data = response.json()
-
-    # Verify database status structure
+def _check_database_status(data):
+    """Database status endpoint reports connection and counts."""
     assert "status" in data
     assert "database_path" in data
     assert "recipes_count" in data
@@ -44,25 +33,16 @@ def test_database_status():
     assert isinstance(data["shopping_lists_count"], int)
 
 
-def test_health_check():
-    """Test the basic health check endpoint."""
-    response = client.get("/api/v1/health/")
-    assert response.status_code == 200
-    data = response.json()
-
-    # Basic response structure
+def _check_health(data):
+    """Basic health check endpoint."""
     assert data["status"] == "healthy"
     assert data["service"] == "chef-agent-api"
     assert data["version"] == "1.0.0"
     assert "message" in data
 
 
-def test_detailed_health_check():
-    response = client.get("/api/v1/health/detailed")
-    assert response.status_code == 200
-    data = response.json()
-
-    # Basic response structure
+def _check_detailed_health(data):
+    """Detailed health check covers database, configuration and memory."""
     assert data["status"] in [
         "healthy",
         "degraded",
@@ -82,3 +62,44 @@ def test_detailed_health_check():
     # Check that memory is tested
     assert "memory" in data["checks"]
     assert "status" in data["checks"]["memory"]
+
+
+ENDPOINT_CHECKS = {
+    "/": _check_root,
+    "/api/v1/health/": _check_health,
+    "/api/v1/health/detailed": _check_detailed_health,
+    "/db/status": _check_database_status,
+}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        pytest.param("/", id="root"),
+        pytest.param("/api/v1/health/", id="health"),
+        # Probes the database, configuration and memory subsystems
+        pytest.param(
+            "/api/v1/health/detailed",
+            id="detailed_health",
+            marks=pytest.mark.slow,
+        ),
+        pytest.param("/db/status", id="db_status"),
+    ],
+)
+def test_endpoint(client, path):
+    """Test each top-level endpoint responds with its expected payload."""
+    response = client.get(path)
+    assert response.status_code == 200
+    ENDPOINT_CHECKS[path](response.json())
+
+
+@pytest.mark.slow
+async def test_endpoints_concurrently(async_client):
+    """Test all top-level endpoints respond when requested concurrently."""
+    responses = await asyncio.gather(
+        *(async_client.get(path) for path in ENDPOINT_CHECKS)
+    )
+
+    for (path, check), response in zip(ENDPOINT_CHECKS.items(), responses):
+        assert response.status_code == 200, path
+        check(response.json())
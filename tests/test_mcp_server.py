@@ -2,122 +2,123 @@
 Tests for MCP server functionality.
 """
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from mcp.types import TextContent
 
 from adapters.mcp.client import ChefAgentMCPClient
 from adapters.mcp.server import ChefAgentMCPServer
-from domain.entities import (
-    DietType,
-    Ingredient,
-    Recipe,
-    ShoppingItem,
-    ShoppingList,
-)
+from domain.entities import ShoppingItem, ShoppingList
+from tests._fast_patch import swap_attr, swap_attrs
 from tests.base_test import BaseDatabaseTest
+from tests.fixtures.recipes import MOCK_PASTA, MOCK_QUICK_PASTA, TEST_USER_ID
+
+# Tool results returned by the mocked MCP session; the client passes
+# already-parsed dicts through without JSON decoding
+_FIND_RECIPES_RESPONSE = {
+    "recipes": [{"title": "Test Recipe", "id": 1}],
+    "total_found": 1,
+}
+_CREATE_LIST_RESPONSE = [
+    TextContent(
+        type="text", text='{"action":"created","thread_id":"test-123"}'
+    )
+]
+
+
+@pytest.fixture
+def empty_list():
+    """Stored shopping list without items."""
+    shopping_list = ShoppingList(items=[], user_id=TEST_USER_ID)
+    shopping_list.id = 1
+    return shopping_list
+
+
+@pytest.fixture
+def list_with_pasta():
+    """Stored shopping list holding a single pasta item."""
+    shopping_list = ShoppingList(
+        items=[
+            ShoppingItem(
+                name="pasta", quantity="500g", unit="g", category="pantry"
+            )
+        ]
+    )
+    shopping_list.id = 1
+    return shopping_list
 
 
-class TestChefAgentMCPServer(BaseDatabaseTest):
-    """Test cases for ChefAgentMCPServer."""
-
-    def setup_method(self):
-        """Set up test fixtures for each test method."""
-        super().setup_method()
-
-        # Create MCP server with test database
-        self.server = ChefAgentMCPServer()
-        # Replace the database and repositories
-        self.server.db = self.db
-        self.server.recipe_repo = self.recipe_repo
-        self.server.shopping_repo = self.shopping_repo
-
-        # Also update the db reference in repositories
-        self.server.recipe_repo.db = self.db
-        self.server.shopping_repo.db = self.db
-
-    @pytest.mark.asyncio
-    async def test_recipe_finder_basic_search(self):
-        """Test basic recipe search functionality."""
-        # Mock the recipe repository
-        mock_recipe = Recipe(
-            id=1,
-            title="Test Pasta",
-            description="A simple pasta dish",
-            instructions="Cook pasta, add sauce",
-            prep_time_minutes=10,
-            cook_time_minutes=15,
-            servings=4,
-            difficulty="easy",
-            tags=["italian", "pasta"],
-            diet_type=DietType.VEGETARIAN,
-            ingredients=[
-                Ingredient(name="pasta", quantity="500g", unit="g"),
-                Ingredient(name="tomato sauce", quantity="400ml", unit="ml"),
-            ],
-            user_id=self.test_user_id,
-        )
+@pytest.fixture(scope="class")
+def shared_mcp_server():
+    """MCP server constructed once per test class."""
+    server = ChefAgentMCPServer()
+    default_db = server.db
+    yield server
+    default_db.close()
 
-        with patch.object(
-            self.server.recipe_repo,
-            "search_recipes",
-            return_value=[mock_recipe],
-        ):
-            result = await self.server._handle_recipe_finder(
-                {"query": "pasta", "user_id": "test-user"}
-            )
 
-            assert "recipes" in result
-            assert result["total_found"] == 1
-            assert result["recipes"][0]["title"] == "Test Pasta"
-            assert result["recipes"][0]["tags"] == ["italian", "pasta"]
-
-    @pytest.mark.asyncio
-    async def test_recipe_finder_with_filters(self):
-        """Test recipe search with filters."""
-        mock_recipe = Recipe(
-            id=1,
-            title="Quick Pasta",
-            description="Fast pasta dish",
-            instructions="Cook quickly",
-            prep_time_minutes=5,
-            cook_time_minutes=10,
-            servings=2,
-            difficulty="easy",
-            tags=["quick", "pasta"],
-            diet_type=DietType.VEGETARIAN,
-            ingredients=[],
-            user_id=self.test_user_id,
-        )
+@pytest.mark.xdist_group(name="mcp_server")
+class TestChefAgentMCPServer(BaseDatabaseTest):
+    """Test cases for ChefAgentMCPServer."""
 
-        with patch.object(
-            self.server.recipe_repo,
-            "search_recipes",
-            return_value=[mock_recipe],
-        ):
-            result = await self.server._handle_recipe_finder(
+    @pytest.fixture
+    def mcp_server(self, shared_mcp_server):
+        """Shared MCP server pointed at this test's database."""
+        shared_mcp_server.db = self.db
+        shared_mcp_server.recipe_repo = self.recipe_repo
+        shared_mcp_server.shopping_repo = self.shopping_repo
+        return shared_mcp_server
+
+    @pytest.mark.parametrize("include_user_id", [True, False])
+    @pytest.mark.parametrize(
+        "args, recipe",
+        [
+            pytest.param({"query": "pasta"}, MOCK_PASTA, id="basic"),
+            pytest.param(
                 {
                     "query": "pasta",
                     "tags": ["quick"],
                     "max_prep_time": 10,
                     "servings": 2,
-                    "user_id": "test-user",
-                }
-            )
+                },
+                MOCK_QUICK_PASTA,
+                id="filters",
+            ),
+        ],
+    )
+    async def test_recipe_finder(
+        self, mcp_server, args, recipe, include_user_id
+    ):
+        """Test recipe search, which requires an explicit user_id."""
+        args = dict(args)
+        if include_user_id:
+            args["user_id"] = "test-user"
+
+        with swap_attr(
+            mcp_server.recipe_repo,
+            "search_recipes",
+            lambda *args, **kwargs: [recipe],
+        ):
+            result = await mcp_server._handle_recipe_finder(args)
 
-            assert result["total_found"] == 1
-            assert result["recipes"][0]["title"] == "Quick Pasta"
+        if not include_user_id:
+            assert result["error"] == "user_id is required for recipe search"
+            assert result["total_found"] == 0
+            return
 
-    @pytest.mark.asyncio
-    async def test_shopping_list_create(self):
-        """Test shopping list creation."""
-        with patch.object(self.server.shopping_repo, "create") as mock_create:
-            mock_list = ShoppingList(items=[], user_id=self.test_user_id)
-            mock_list.id = 1
-            mock_create.return_value = mock_list
+        assert result["total_found"] == 1
+        assert result["recipes"][0]["title"] == recipe.title
+        assert result["recipes"][0]["tags"] == recipe.tags
 
-            result = await self.server._handle_shopping_list_manager(
+    async def test_shopping_list_create(self, mcp_server, empty_list):
+        """Test shopping list creation."""
+        with swap_attr(
+            mcp_server.shopping_repo,
+            "create",
+            lambda *args, **kwargs: empty_list,
+        ):
+            result = await mcp_server._handle_shopping_list_manager(
                 {
                     "action": "create",
                     "thread_id": "test-123",
@@ -129,25 +130,14 @@ class TestChefAgentMCPServer(BaseDatabaseTest):
             assert result["thread_id"] == "test-123"
             assert result["items"] == []
 
-    @pytest.mark.asyncio
-    async def test_shopping_list_add_items(self):
+    async def test_shopping_list_add_items(self, mcp_server, empty_list):
         """Test adding items to shopping list."""
-        # Mock existing shopping list
-        mock_list = ShoppingList(items=[], user_id=self.test_user_id)
-        mock_list.id = 1
-
-        with (
-            patch.object(
-                self.server.shopping_repo,
-                "get_by_thread_id",
-                return_value=mock_list,
-            ),
-            patch.object(self.server.shopping_repo, "update") as mock_update,
+        with swap_attrs(
+            mcp_server.shopping_repo,
+            get_by_thread_id=lambda *args, **kwargs: empty_list,
+            update=lambda *args, **kwargs: empty_list,
         ):
-
-            mock_update.return_value = mock_list
-
-            result = await self.server._handle_shopping_list_manager(
+            result = await mcp_server._handle_shopping_list_manager(
                 {
                     "action": "add_items",
                     "thread_id": "test-123",
@@ -166,28 +156,17 @@ class TestChefAgentMCPServer(BaseDatabaseTest):
             assert result["action"] == "items_added"
             assert result["thread_id"] == "test-123"
             assert result["added_items"] == 1
+            assert result["list_id"] == empty_list.id
+            assert [item.name for item in empty_list.items] == ["pasta"]
 
-    @pytest.mark.asyncio
-    async def test_shopping_list_get(self):
+    async def test_shopping_list_get(self, mcp_server, list_with_pasta):
         """Test getting shopping list."""
-        mock_list = ShoppingList(
-            items=[
-                ShoppingItem(
-                    name="pasta",
-                    quantity="500g",
-                    unit="g",
-                    category="pantry",
-                )
-            ]
-        )
-        mock_list.id = 1
-
-        with patch.object(
-            self.server.shopping_repo,
+        with swap_attr(
+            mcp_server.shopping_repo,
             "get_by_thread_id",
-            return_value=mock_list,
+            lambda *args, **kwargs: list_with_pasta,
         ):
-            result = await self.server._handle_shopping_list_manager(
+            result = await mcp_server._handle_shopping_list_manager(
                 {
                     "action": "get",
                     "thread_id": "test-123",
@@ -200,11 +179,10 @@ class TestChefAgentMCPServer(BaseDatabaseTest):
             assert len(result["items"]) == 1
             assert result["items"][0]["name"] == "pasta"
 
-    @pytest.mark.asyncio
-    async def test_shopping_list_clear(self):
+    async def test_shopping_list_clear(self, mcp_server):
         """Test clearing shopping list."""
-        with patch.object(self.server.shopping_repo, "clear") as mock_clear:
-            result = await self.server._handle_shopping_list_manager(
+        with patch.object(mcp_server.shopping_repo, "clear") as mock_clear:
+            result = await mcp_server._handle_shopping_list_manager(
                 {
                     "action": "clear",
                     "thread_id": "test-123",
@@ -216,11 +194,10 @@ class TestChefAgentMCPServer(BaseDatabaseTest):
             assert result["thread_id"] == "test-123"
             mock_clear.assert_called_once_with("test-123", "test-user")
 
-    @pytest.mark.asyncio
-    async def test_shopping_list_delete(self):
+    async def test_shopping_list_delete(self, mcp_server):
         """Test deleting shopping list (real DB, no mocks)."""
         # 1. Create shopping list
-        create_result = await self.server._handle_shopping_list_manager(
+        create_result = await mcp_server._handle_shopping_list_manager(
             {
                 "action": "create",
                 "thread_id": "test-del",
@@ -231,7 +208,7 @@ class TestChefAgentMCPServer(BaseDatabaseTest):
         list_id = create_result["list_id"]
 
         # 2. Delete shopping list
-        result = await self.server._handle_shopping_list_manager(
+        result = await mcp_server._handle_shopping_list_manager(
             {
                 "action": "delete",
                 "thread_id": "test-del",
@@ -244,81 +221,64 @@ class TestChefAgentMCPServer(BaseDatabaseTest):
         assert result["list_id"] == list_id
 
         # 4. Verify it's no longer in the database
-        assert self.server.shopping_repo.get_by_id(list_id) is None
+        assert mcp_server.shopping_repo.get_by_id(list_id) is None
 
-    @pytest.mark.asyncio
-    async def test_unknown_tool(self):
+    async def test_unknown_tool(self, mcp_server):
         """Test handling of unknown tool."""
         # This would be called through the call_tool method
         # We'll test the error handling
-        with patch.object(
-            self.server,
-            "_handle_recipe_finder",
-            side_effect=Exception("Test error"),
+
+        async def failing_recipe_finder(*args, **kwargs):
+            raise Exception("Test error")
+
+        with swap_attr(
+            mcp_server, "_handle_recipe_finder", failing_recipe_finder
         ):
             # Simulate the call_tool method behavior
             try:
-                await self.server._handle_recipe_finder(
+                await mcp_server._handle_recipe_finder(
                     {"query": "test", "user_id": "test-user"}
                 )
             except Exception as e:
                 assert str(e) == "Test error"
 
 
+@pytest.mark.xdist_group(name="mcp_client")
 class TestChefAgentMCPClient:
     """Test cases for ChefAgentMCPClient."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = ChefAgentMCPClient()
+    @pytest.fixture(scope="class")
+    def mcp_client(self):
+        """Client shared by the tests that swap in a mocked session."""
+        return ChefAgentMCPClient()
 
-    @pytest.mark.asyncio
-    async def test_find_recipes(self):
+    async def test_find_recipes(self, mcp_client):
         """Test recipe finding through client."""
-        with patch.object(self.client, "session") as mock_session:
-
-            async def mock_call_tool(tool_name, arguments):
-                return [
-                    TextContent(
-                        type="text",
-                        text=(
-                            '{"recipes": [{"title": "Test Recipe", "id": 1}], '
-                            '"total_found": 1}'
-                        ),
-                    )
-                ]
-
-            mock_session.call_tool = mock_call_tool
+        with swap_attr(mcp_client, "session", Mock()) as mock_session:
+            mock_session.call_tool = AsyncMock(
+                return_value=_FIND_RECIPES_RESPONSE
+            )
 
-            result = await self.client.find_recipes(query="test")
+            result = await mcp_client.find_recipes(query="test")
 
             assert result["total_found"] == 1
             assert result["recipes"][0]["title"] == "Test Recipe"
 
-    @pytest.mark.asyncio
-    async def test_manage_shopping_list(self):
+    async def test_manage_shopping_list(self, mcp_client):
         """Test shopping list management through client."""
-        with patch.object(self.client, "session") as mock_session:
-
-            async def mock_call_tool(tool_name, arguments):
-                return [
-                    TextContent(
-                        type="text",
-                        text='{"action": "created", "thread_id": "test-123"}',
-                    )
-                ]
-
-            mock_session.call_tool = mock_call_tool
+        with swap_attr(mcp_client, "session", Mock()) as mock_session:
+            mock_session.call_tool = AsyncMock(
+                return_value=_CREATE_LIST_RESPONSE
+            )
 
-            result = await self.client.manage_shopping_list(
+            result = await mcp_client.manage_shopping_list(
                 "create", "test-123"
             )
 
             assert result["action"] == "created"
             assert result["thread_id"] == "test-123"
 
-    @pytest.mark.asyncio
     async def test_client_not_connected_error(self):
         """Test error when client is not connected."""
         with pytest.raises(RuntimeError, match="Client not connected"):
-            await self.client.find_recipes(query="test")
+            await ChefAgentMCPClient().find_recipes(query="test")
@@ -4,64 +4,13 @@ Tests for meal plan generation functionality.
 
 import pytest
 
-from domain.entities import DietType, Ingredient, Recipe
+from domain.entities import DietType, Ingredient, MealPlan, Recipe
 from domain.meal_plan_generator import MealPlanGenerator
 
 
 class TestMealPlanGenerator:
     """Test cases for MealPlanGenerator."""
 
-    @pytest.fixture
-    def sample_recipes(self):
-        """Create sample recipes for testing."""
-        return [
-            Recipe(
-                id=1,
-                title="Vegetarian Pasta",
-                description="A delicious vegetarian pasta dish",
-                instructions="Cook pasta, add vegetables",
-                ingredients=[
-                    Ingredient(name="pasta", quantity="200", unit="g"),
-                    Ingredient(name="tomato", quantity="2", unit="pieces"),
-                    Ingredient(name="onion", quantity="1", unit="piece"),
-                ],
-                diet_type=DietType.VEGETARIAN,
-                prep_time_minutes=15,
-                cook_time_minutes=20,
-                servings=4,
-            ),
-            Recipe(
-                id=2,
-                title="Chicken Salad",
-                description="Healthy chicken salad",
-                instructions="Mix chicken with vegetables",
-                ingredients=[
-                    Ingredient(name="chicken", quantity="300", unit="g"),
-                    Ingredient(name="lettuce", quantity="1", unit="head"),
-                    Ingredient(name="tomato", quantity="1", unit="piece"),
-                ],
-                diet_type=DietType.HIGH_PROTEIN,
-                prep_time_minutes=10,
-                cook_time_minutes=0,
-                servings=2,
-            ),
-            Recipe(
-                id=3,
-                title="Vegan Curry",
-                description="Spicy vegan curry",
-                instructions="Cook vegetables in curry sauce",
-                ingredients=[
-                    Ingredient(name="coconut milk", quantity="400", unit="ml"),
-                    Ingredient(name="curry powder", quantity="2", unit="tbsp"),
-                    Ingredient(name="potato", quantity="2", unit="pieces"),
-                ],
-                diet_type=DietType.VEGAN,
-                prep_time_minutes=20,
-                cook_time_minutes=30,
-                servings=3,
-            ),
-        ]
-
     def test_generate_meal_plan_basic(self, sample_recipes):
         """Test basic meal plan generation."""
         meal_plan, fallback_used = MealPlanGenerator.generate_meal_plan(
@@ -73,14 +22,38 @@ class TestMealPlanGenerator:
         assert meal_plan.diet_type == DietType.VEGETARIAN
         assert meal_plan.created_at is not None
 
-    def test_generate_meal_plan_empty_recipes(self):
-        """Test meal plan generation with empty recipe list."""
-        with pytest.raises(
-            ValueError, match="Cannot generate meal plan: no recipes available"
-        ):
-            MealPlanGenerator.generate_meal_plan(
-                recipes=[], diet_goal="vegetarian", days_count=3
-            )
+    def test_generate_meal_plan_result_fields(self, sample_recipes):
+        """Test that the result exposes named fields and still unpacks."""
+        result = MealPlanGenerator.generate_meal_plan(
+            recipes=sample_recipes, diet_goal="vegetarian", days_count=3
+        )
+
+        meal_plan, fallback_used = result
+        assert result.meal_plan is meal_plan
+        assert result.fallback_used is fallback_used is False
+
+    def test_generate_meal_plan_uses_clock(self, sample_recipes, frozen_now):
+        """Test that created_at comes from the injected clock."""
+        meal_plan = MealPlanGenerator.generate_meal_plan(
+            recipes=sample_recipes,
+            diet_goal="vegetarian",
+            days_count=3,
+            now=frozen_now,
+        ).meal_plan
+
+        assert meal_plan.created_at == "2024-01-01T12:00:00"
+
+    def test_generate_meal_plan_accepts_diet_type(self, sample_recipes):
+        """Test that a DietType works as the diet goal."""
+        meal_plan, fallback_used = MealPlanGenerator.generate_meal_plan(
+            recipes=sample_recipes, diet_goal=DietType.VEGAN, days_count=3
+        )
+
+        assert meal_plan.diet_type is DietType.VEGAN
+        assert fallback_used is False
+        assert {
+            meal.recipe.title for day in meal_plan.days for meal in day.meals
+        } == {"Vegan Curry"}
 
     def test_generate_meal_plan_diet_filtering(self, sample_recipes):
         """Test that recipes are filtered by diet goal."""
@@ -134,36 +107,67 @@ class TestMealPlanGenerator:
         # Should only include vegan recipes
         assert len(vegan_recipes) >= 1
 
-    def test_determine_diet_type(self):
-        """Test determining diet type from diet goal."""
-        assert (
-            MealPlanGenerator._determine_diet_type("vegetarian")
-            == DietType.VEGETARIAN
-        )
-        assert (
-            MealPlanGenerator._determine_diet_type("vegan") == DietType.VEGAN
+    @pytest.mark.parametrize(
+        "diet_goal, expected_titles",
+        [
+            ("Vegetarian", ["Vegetarian Pasta", "Vegan Curry"]),
+            ("vegan", ["Vegan Curry"]),
+            (DietType.VEGETARIAN, ["Vegetarian Pasta", "Vegan Curry"]),
+            ("keto", []),
+            (
+                "mediterranean",
+                ["Vegetarian Pasta", "Chicken Salad", "Vegan Curry"],
+            ),
+        ],
+    )
+    def test_filter_recipes_by_diet_goal(
+        self, sample_recipes, diet_goal, expected_titles
+    ):
+        """Test which diet types each diet goal accepts."""
+        filtered = MealPlanGenerator._filter_recipes_by_diet(
+            sample_recipes, diet_goal
         )
-        assert (
-            MealPlanGenerator._determine_diet_type("low-carb")
-            == DietType.LOW_CARB
+
+        assert [r.title for r in filtered] == expected_titles
+
+    @pytest.mark.parametrize(
+        "diet_goal, expected",
+        [
+            ("vegetarian", DietType.VEGETARIAN),
+            ("vegan", DietType.VEGAN),
+            ("low-carb", DietType.LOW_CARB),
+            ("unknown", None),
+            (None, None),
+        ],
+    )
+    def test_determine_diet_type(self, diet_goal, expected):
+        """Test determining diet type from diet goal."""
+        assert MealPlanGenerator._determine_diet_type(diet_goal) is expected
+
+    def test_generate_meal_plan_without_diet_goal(self, sample_recipes):
+        """Test that a missing diet goal uses every recipe."""
+        meal_plan, fallback_used = MealPlanGenerator.generate_meal_plan(
+            recipes=sample_recipes, diet_goal=None, days_count=3
         )
-        assert MealPlanGenerator._determine_diet_type("unknown") is None
+
+        assert fallback_used is False
+        assert meal_plan.diet_type is None
+        assert meal_plan.days[0].notes.startswith("Day 1 of regular")
 
     def test_validate_meal_plan(self, sample_recipes):
         """Test meal plan validation."""
         # Valid meal plan
-        valid_plan, _ = MealPlanGenerator.generate_meal_plan(
+        valid_plan = MealPlanGenerator.generate_meal_plan(
             recipes=sample_recipes, diet_goal="vegetarian", days_count=3
-        )
+        ).meal_plan
         assert MealPlanGenerator.validate_meal_plan(valid_plan) is True
 
-        # Invalid meal plan (empty days) - should raise error
-        with pytest.raises(
-            ValueError, match="Cannot generate meal plan: no recipes available"
-        ):
-            MealPlanGenerator.generate_meal_plan(
-                recipes=[], diet_goal="vegetarian", days_count=3
-            )
+        # Invalid meal plan (empty days)
+        assert MealPlanGenerator.validate_meal_plan(MealPlan()) is False
+
+        # Invalid meal plan (a day without meals)
+        valid_plan.days[1].meals = []
+        assert MealPlanGenerator.validate_meal_plan(valid_plan) is False
 
     def test_meal_plan_shopping_list_generation(self, sample_recipes):
         """Test that meal plan can generate shopping list."""
@@ -224,15 +228,6 @@ class TestMealPlanGenerator:
         assert meal_plan.total_days == 3
         assert meal_plan.diet_type == DietType.VEGETARIAN
 
-    def test_fallback_with_empty_recipes(self):
-        """Test fallback behavior with empty recipe list."""
-        with pytest.raises(
-            ValueError, match="Cannot generate meal plan: no recipes available"
-        ):
-            MealPlanGenerator.generate_meal_plan(
-                recipes=[], diet_goal="vegetarian", days_count=3
-            )
-
     def test_maximum_days_count_seven(self, sample_recipes):
         """Test meal plan generation with maximum days count (7)."""
         meal_plan, fallback_used = MealPlanGenerator.generate_meal_plan(
@@ -251,54 +246,22 @@ class TestMealPlanGenerator:
             assert day.meals[1].name == "lunch"
             assert day.meals[2].name == "dinner"
 
-    def test_days_count_validation_boundary_values(self, sample_recipes):
-        """Test days_count validation with boundary values."""
-        # Test minimum valid value (3)
-        meal_plan, _ = MealPlanGenerator.generate_meal_plan(
-            recipes=sample_recipes, diet_goal="vegetarian", days_count=3
-        )
-        assert meal_plan.total_days == 3
-
-        # Test maximum valid value (7)
-        meal_plan, _ = MealPlanGenerator.generate_meal_plan(
-            recipes=sample_recipes, diet_goal="vegetarian", days_count=7
-        )
-        assert meal_plan.total_days == 7
-
-        # Test invalid values
-        with pytest.raises(
-            ValueError, match="days_count must be an integer between 3 and 7"
-        ):
-            MealPlanGenerator.generate_meal_plan(
-                recipes=sample_recipes, diet_goal="vegetarian", days_count=2
-            )
-
+    @pytest.mark.parametrize("days", [3, 7])
+    def test_days_count_valid_boundaries(self, sample_recipes, days):
+        """Test that the smallest and largest days_count are accepted."""
+        meal_plan = MealPlanGenerator.generate_meal_plan(
+            recipes=sample_recipes, diet_goal="vegetarian", days_count=days
+        ).meal_plan
+        assert meal_plan.total_days == days
+
+    @pytest.mark.parametrize("days", [2, 8, 0, -1, "3"])
+    def test_days_count_invalid(self, sample_recipes, days):
+        """Test that out-of-range or non-integer days_count is rejected."""
         with pytest.raises(
             ValueError, match="days_count must be an integer between 3 and 7"
         ):
             MealPlanGenerator.generate_meal_plan(
-                recipes=sample_recipes, diet_goal="vegetarian", days_count=8
-            )
-
-        with pytest.raises(
-            ValueError, match="days_count must be an integer between 3 and 7"
-        ):
-            MealPlanGenerator.generate_meal_plan(
-                recipes=sample_recipes, diet_goal="vegetarian", days_count=0
-            )
-
-        with pytest.raises(
-            ValueError, match="days_count must be an integer between 3 and 7"
-        ):
-            MealPlanGenerator.generate_meal_plan(
-                recipes=sample_recipes, diet_goal="vegetarian", days_count=-1
-            )
-
-        with pytest.raises(
-            ValueError, match="days_count must be an integer between 3 and 7"
-        ):
-            MealPlanGenerator.generate_meal_plan(
-                recipes=sample_recipes, diet_goal="vegetarian", days_count="3"
+                recipes=sample_recipes, diet_goal="vegetarian", days_count=days
             )
 
     def test_meal_plan_with_maximum_days_and_limited_recipes(self):
@@ -337,19 +300,46 @@ class TestMealPlanGenerator:
         for day in meal_plan.days:
             assert len(day.meals) == 3
 
+        # Recipes are cycled evenly across the 21 meals
+        titles = [
+            meal.recipe.title for day in meal_plan.days for meal in day.meals
+        ]
+        assert sorted(set(titles)) == ["Recipe 1", "Recipe 2"]
+        assert abs(titles.count("Recipe 1") - titles.count("Recipe 2")) <= 1
+
+    def test_generate_meal_plan_is_deterministic(self, sample_recipes):
+        """Test that the same recipes always give the same meal order."""
+
+        def titles():
+            meal_plan = MealPlanGenerator.generate_meal_plan(
+                recipes=sample_recipes[:2], diet_goal="any", days_count=3
+            ).meal_plan
+            return [
+                meal.recipe.title
+                for day in meal_plan.days
+                for meal in day.meals
+            ]
+
+        assert titles() == titles()
+        assert titles()[:3] == [
+            "Vegetarian Pasta",
+            "Chicken Salad",
+            "Vegetarian Pasta",
+        ]
+
     def test_meal_plan_shopping_list_with_maximum_days(self, sample_recipes):
         """Test shopping list generation with maximum days (7)."""
-        meal_plan, _ = MealPlanGenerator.generate_meal_plan(
+        meal_plan = MealPlanGenerator.generate_meal_plan(
             recipes=sample_recipes, diet_goal="vegetarian", days_count=7
-        )
+        ).meal_plan
 
         shopping_list = meal_plan.get_shopping_list()
         assert shopping_list is not None
         assert len(shopping_list.items) > 0
 
         # Should have more items than 3-day plan
-        three_day_plan, _ = MealPlanGenerator.generate_meal_plan(
+        three_day_plan = MealPlanGenerator.generate_meal_plan(
             recipes=sample_recipes, diet_goal="vegetarian", days_count=3
-        )
+        ).meal_plan
         three_day_shopping = three_day_plan.get_shopping_list()
         assert len(shopping_list.items) >= len(three_day_shopping.items)
@@ -5,93 +5,58 @@ This module tests that all modules can be imported without errors
 and basic functionality works without mocks.
 """
 
-# No additional imports needed
+import importlib
+
+import pytest
 
 
 class TestModuleImports:
     """Test that all modules can be imported without errors."""
 
-    def test_main_module_import(self):
-        """Test that main module can be imported."""
-        # This should work without any mocks
-        import main
-
-        assert hasattr(main, "app")
-        assert hasattr(main, "db")
-
-    def test_api_modules_import(self):
-        """Test that all API modules can be imported."""
-        # Test individual API modules
-        import api.chat
-        import api.health
-        import api.recipes
-        import api.shopping
-
-        # Test that routers are defined
-        assert hasattr(api.health, "router")
-        assert hasattr(api.recipes, "router")
-        assert hasattr(api.shopping, "router")
-        assert hasattr(api.chat, "router")
-
-    def test_chat_module_functions_exist(self):
-        """Test that chat module has required functions."""
+    @pytest.mark.parametrize(
+        "module_name, attr",
+        [
+            # main should import without any mocks
+            ("main", "app"),
+            ("main", "db"),
+            ("api.health", "router"),
+            ("api.recipes", "router"),
+            ("api.shopping", "router"),
+            ("api.chat", "router"),
+            ("api.chat", "get_agent"),
+            ("api.shopping", "serialize_shopping_list"),
+            ("api.shopping", "validate_thread_id"),
+            ("api.shopping", "shopping_repo"),
+            ("config", "settings"),
+            ("config", "Settings"),
+            ("agent", "ChefAgentGraph"),
+            ("agent.graph", "ChefAgentGraph"),
+            ("agent.memory", "MemoryManager"),
+            ("agent.models", "ChatRequest"),
+            ("agent.models", "ChatResponse"),
+            ("agent.tools", "create_chef_tools"),
+            ("adapters.db", "Database"),
+            ("adapters.llm", "GroqAdapter"),
+            ("adapters.llm", "OpenAIAdapter"),
+            ("adapters.mcp", "ChefAgentMCPClient"),
+            ("domain.entities", "Recipe"),
+            ("domain.entities", "ShoppingList"),
+            ("domain.entities", "ShoppingItem"),
+            ("domain.repo_abc", "RecipeRepository"),
+        ],
+    )
+    def test_module_exports(self, module_name, attr):
+        """Test that a module imports and defines the expected attribute."""
+        module = importlib.import_module(module_name)
+
+        assert hasattr(module, attr)
+
+    def test_chat_get_agent_is_callable(self):
+        """Test that the chat module's get_agent function is callable."""
         import api.chat
 
-        # Test that get_agent function exists and is callable
-        assert hasattr(api.chat, "get_agent")
         assert callable(api.chat.get_agent)
 
-    def test_shopping_module_functions_exist(self):
-        """Test that shopping module has required functions."""
-        import api.shopping
-
-        # Test that required functions exist
-        assert hasattr(api.shopping, "serialize_shopping_list")
-        assert hasattr(api.shopping, "validate_thread_id")
-        assert hasattr(api.shopping, "shopping_repo")
-
-    def test_config_module_import(self):
-        """Test that config module can be imported."""
-        import config
-
-        assert hasattr(config, "settings")
-        assert hasattr(config, "Settings")
-
-    def test_agent_modules_import(self):
-        """Test that agent modules can be imported."""
-        import agent
-        import agent.graph
-        import agent.memory
-        import agent.models
-        import agent.tools
-
-        # Test that main classes exist
-        assert hasattr(agent, "ChefAgentGraph")
-        assert hasattr(agent.memory, "MemoryManager")
-        assert hasattr(agent.models, "ChatRequest")
-        assert hasattr(agent.models, "ChatResponse")
-
-    def test_adapters_import(self):
-        """Test that adapter modules can be imported."""
-        import adapters.db
-        import adapters.llm
-        import adapters.mcp
-
-        # Test that main classes exist
-        assert hasattr(adapters.db, "Database")
-        assert hasattr(adapters.llm, "GroqAdapter")
-        assert hasattr(adapters.llm, "OpenAIAdapter")
-
-    def test_domain_modules_import(self):
-        """Test that domain modules can be imported."""
-        import domain.entities
-        import domain.repo_abc
-
-        # Test that main classes exist
-        assert hasattr(domain.entities, "Recipe")
-        assert hasattr(domain.entities, "ShoppingList")
-        assert hasattr(domain.entities, "ShoppingItem")
-
 
 class TestModuleFunctionality:
     """Test basic functionality without mocks."""
@@ -106,57 +71,63 @@ class TestModuleFunctionality:
         assert hasattr(settings, "api_host")
         assert hasattr(settings, "api_port")
 
-    def test_database_connection(self):
+    def test_database_connection(self, memory_db):
         """Test that database can be created and connected."""
+        # Test that we can get a connection
+        conn = memory_db.get_connection()
+        assert conn is not None
+
+        # Test that we can execute a simple query
+        cursor = conn.execute("SELECT 1 as test")
+        result = cursor.fetchone()
+        assert result["test"] == 1
+
+    def test_memory_database_shared_across_threads(self, memory_db):
+        """Test that other threads see the migrated in-memory schema."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def count_recipes():
+            conn = memory_db.get_connection()
+            try:
+                return conn.execute("SELECT COUNT(*) FROM recipes").fetchone()
+            finally:
+                memory_db.close()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(count_recipes).result()[0] == 0
+
+    def test_plain_memory_database_is_private(self):
+        """Test that ":memory:" only uses a shared cache when asked to."""
         from adapters.db import Database
 
-        # Create a temporary database
-        db = Database(":memory:")  # In-memory database for testing
-
+        db = Database(":memory:")
         try:
-            # Test that we can get a connection
-            conn = db.get_connection()
-            assert conn is not None
-
-            # Test that we can execute a simple query
-            cursor = conn.execute("SELECT 1 as test")
-            result = cursor.fetchone()
-            assert result["test"] == 1
-
+            assert db._uri is None
+            assert db.db_path == ":memory:"
         finally:
             db.close()
 
-    def test_recipe_repository_creation(self):
+    def test_recipe_repository_creation(self, memory_db):
         """Test that recipe repository can be created."""
-        from adapters.db import Database
         from adapters.db.recipe_repository import SQLiteRecipeRepository
 
-        db = Database(":memory:")
-        try:
-            repo = SQLiteRecipeRepository(db)
-            assert repo is not None
-            assert hasattr(repo, "save")
-            assert hasattr(repo, "get_by_id")
-            assert hasattr(repo, "get_all")
-        finally:
-            db.close()
+        repo = SQLiteRecipeRepository(memory_db)
+        assert repo is not None
+        assert hasattr(repo, "save")
+        assert hasattr(repo, "get_by_id")
+        assert hasattr(repo, "get_all")
 
-    def test_shopping_repository_creation(self):
+    def test_shopping_repository_creation(self, memory_db):
         """Test that shopping repository can be created."""
-        from adapters.db import Database
         from adapters.db.shopping_list_repository import (
             SQLiteShoppingListRepository,
         )
 
-        db = Database(":memory:")
-        try:
-            repo = SQLiteShoppingListRepository(db)
-            assert repo is not None
-            assert hasattr(repo, "create")
-            assert hasattr(repo, "get_by_id")
-            assert hasattr(repo, "get_by_thread_id")
-        finally:
-            db.close()
+        repo = SQLiteShoppingListRepository(memory_db)
+        assert repo is not None
+        assert hasattr(repo, "create")
+        assert hasattr(repo, "get_by_id")
+        assert hasattr(repo, "get_by_thread_id")
 
 
 class TestErrorHandling:
@@ -5,60 +5,64 @@ These tests verify that the API can handle reasonable loads
 and performs well under stress.
 """
 
+import asyncio
+import statistics
 import time
-from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-
-from main import app
 
 # Performance tests are skipped by default
 # Run with: pytest -m performance
 
+# Throttled loops only pause once responses get slower than this
+SLOW_RESPONSE_SECONDS = 0.05
+
+RECIPES_URL = "/api/v1/recipes/"
+
+# Endpoints timed one per test so they can spread across xdist workers
+ENDPOINTS = (
+    "/",
+    "/api/v1/health/",
+    RECIPES_URL,
+    "/api/v1/recipes/diet-types/",
+    "/api/v1/recipes/difficulty-levels/",
+    "/api/v1/chat/threads",
+)
+
 
 @pytest.mark.performance
 class TestPerformance:
     """Performance and load tests."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_concurrent_requests(self, client):
+    async def test_concurrent_requests(self, async_client):
         """Test API performance under concurrent load."""
-
-        def make_request():
-            response = client.get("/api/v1/health/")
-            return response.status_code, time.time()
-
         # Make 50 concurrent requests
-        start_time = time.time()
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(make_request) for _ in range(50)]
-            results = [future.result() for future in futures]
-
-        end_time = time.time()
-        total_time = end_time - start_time
+        start_time = time.perf_counter()
+        responses = await asyncio.gather(
+            *(async_client.get("/api/v1/health/") for _ in range(50))
+        )
+        total_time = time.perf_counter() - start_time
 
         # All requests should succeed
-        status_codes = [result[0] for result in results]
-        assert all(code == 200 for code in status_codes)
+        assert all(response.status_code == 200 for response in responses)
 
         # Should complete within reasonable time (5 seconds)
         assert total_time < 5.0
 
         # Calculate requests per second
-        rps = len(results) / total_time
+        rps = len(responses) / total_time
         assert rps > 10  # Should handle at least 10 RPS
 
     def test_database_query_performance(self, client):
         """Test database query performance."""
         # Test recipe search performance
-        start_time = time.time()
-        response = client.get("/api/v1/recipes/?query=pasta&limit=100")
-        end_time = time.time()
+        start_time = time.perf_counter()
+        response = client.get(
+            RECIPES_URL, params={"query": "pasta", "limit": 100}
+        )
+        end_time = time.perf_counter()
 
         assert response.status_code == 200
         query_time = end_time - start_time
@@ -72,15 +76,16 @@ class TestPerformance:
         initial_memory = self._get_memory_usage()
 
         # Make many requests with rate limiting
-        import time
-
+        response_times = []
         for i in range(50):  # Reduced from 100 to 50
+            start_time = time.perf_counter()
             response = client.get("/api/v1/health/")
+            response_times.append(time.perf_counter() - start_time)
             assert response.status_code == 200
 
-            # Add small delay to prevent overwhelming the server
-            if i % 10 == 0:  # Every 10 requests
-                time.sleep(0.1)  # 100ms delay
+            # Every 10 requests, back off if the server is slowing down
+            if i % 10 == 9:
+                self._back_off_if_slow(response_times[-10:], 0.1)
 
         final_memory = self._get_memory_usage()
 
@@ -90,43 +95,45 @@ class TestPerformance:
 
     def test_response_time_consistency(self, client):
         """Test that response times are consistent."""
+        # Warm up once so the cold first request stays out of the stats
+        assert client.get("/api/v1/health/").status_code == 200
         response_times = []
 
         for i in range(20):
-            start_time = time.time()
+            start_time = time.perf_counter()
             response = client.get("/api/v1/health/")
-            end_time = time.time()
+            end_time = time.perf_counter()
 
             assert response.status_code == 200
             response_times.append(end_time - start_time)
 
-            # Add small delay to prevent overwhelming the server
-            if i % 5 == 0:  # Every 5 requests
-                time.sleep(0.05)  # 50ms delay
+            # Every 5 requests, back off if the server is slowing down
+            if i % 5 == 4:
+                self._back_off_if_slow(response_times[-5:], 0.05)
 
         # Calculate statistics
-        avg_time = sum(response_times) / len(response_times)
+        avg_time = statistics.fmean(response_times)
+        median_time = statistics.median(response_times)
         max_time = max(response_times)
         min_time = min(response_times)
 
         # Average response time should be reasonable
         assert avg_time < 0.5  # Under 500ms
 
-        # Max response time shouldn't be too much higher than average
-        # Allow for some variance, especially for the first request
-        assert max_time < avg_time * 5  # Max shouldn't be 5x average
+        # Max response time shouldn't be too much higher than typical; the
+        # median ignores a single slow outlier that would inflate the mean
+        assert max_time < median_time * 5
 
-        # Min response time should be reasonable
-        assert min_time > 0.001  # At least 1ms
+        # The monotonic clock always measures a positive duration
+        assert 0 < min_time <= avg_time
 
     def test_large_payload_handling(self, client):
         """Test handling of large payloads."""
         # Test large shopping list creation
-        large_items = []
-        for i in range(50):  # 50 items (under the 100 limit)
-            large_items.append(
-                {"name": f"Item {i}", "quantity": "1", "unit": "piece"}
-            )
+        large_items = [
+            {"name": f"Item {i}", "quantity": "1", "unit": "piece"}
+            for i in range(50)  # 50 items (under the 100 limit)
+        ]
 
         # This would test adding many items to a shopping list
         # For now, we test the validation function
@@ -140,46 +147,56 @@ class TestPerformance:
         with pytest.raises(Exception):
             validate_shopping_list_size(oversized_items)
 
-    def test_concurrent_database_operations(self, client):
+    async def test_concurrent_database_operations(self, async_client):
         """Test concurrent database operations."""
 
-        def create_recipe_request():
-            recipe_data = {
-                "title": f"Concurrent Recipe {time.time()}",
+        def recipe_data(i):
+            return {
+                "title": f"Concurrent Recipe {i} {uuid4().hex}",
                 "instructions": "Test recipe",
                 "ingredients": [
                     {"name": "test", "quantity": "1", "unit": "piece"}
                 ],
             }
-            response = client.post("/api/v1/recipes/", json=recipe_data)
-            return response.status_code
-
-        # Make 10 concurrent recipe creation requests
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [
-                executor.submit(create_recipe_request) for _ in range(10)
-            ]
-            results = [future.result() for future in futures]
-
-        client.get("/api/v1/health")
-        success_count = sum(1 for code in results if code == 200)
+
+        # Make 10 concurrent recipe creation requests; a request that
+        # errors out counts as a failure instead of aborting the others
+        responses = await asyncio.gather(
+            *(
+                async_client.post("/api/v1/recipes/", json=recipe_data(i))
+                for i in range(10)
+            ),
+            return_exceptions=True,
+        )
+
+        success_count = sum(
+            1
+            for r in responses
+            if isinstance(r, httpx.Response) and r.status_code == 200
+        )
         assert success_count >= 5  # At least half should succeed
 
+    @pytest.mark.xdist_group(name="ratelimit")
     def test_rate_limiting_performance(self, client):
         """Test that rate limiting doesn't significantly impact performance."""
         # Make requests up to the rate limit
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         for i in range(30):  # Under rate limit
             response = client.get("/api/v1/chat/threads")
             assert response.status_code == 200
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         total_time = end_time - start_time
 
         # Should complete quickly even with rate limiting
         assert total_time < 2.0
 
+    def _back_off_if_slow(self, response_times, delay):
+        """Sleep for delay seconds if any recent response took over 50ms."""
+        if max(response_times) > SLOW_RESPONSE_SECONDS:
+            time.sleep(delay)
+
     def _get_memory_usage(self):
         """Get current memory usage (simplified)."""
         import os
@@ -189,43 +206,38 @@ class TestPerformance:
         process = psutil.Process(os.getpid())
         return process.memory_info().rss
 
-    def test_api_endpoint_performance(self, client):
+    @pytest.mark.parametrize("endpoint", ENDPOINTS)
+    def test_api_endpoint_performance(self, client, endpoint):
         """Test performance of different API endpoints."""
-        endpoints = [
-            "/",
-            "/api/v1/health/",
-            "/api/v1/recipes/",
-            "/api/v1/recipes/diet-types/",
-            "/api/v1/recipes/difficulty-levels/",
-            "/api/v1/chat/threads",
-        ]
+        start_time = time.perf_counter()
+        response = client.get(endpoint)
+        end_time = time.perf_counter()
 
-        for endpoint in endpoints:
-            start_time = time.time()
-            response = client.get(endpoint)
-            end_time = time.time()
+        # All endpoints should respond quickly
+        response_time = end_time - start_time
+        assert response_time < 1.0  # Under 1 second
 
-            # All endpoints should respond quickly
-            response_time = end_time - start_time
-            assert response_time < 1.0  # Under 1 second
+        # All endpoints should return valid responses
+        assert response.status_code in [
+            200,
+            404,
+        ]  # 404 is acceptable for some endpoints
 
-            # All endpoints should return valid responses
-            assert response.status_code in [
-                200,
-                404,
-            ]  # 404 is acceptable for some endpoints
-
-    def test_database_connection_pooling(self, client):
+    async def test_database_connection_pooling(self, async_client):
         """Test that database connections are handled efficiently."""
-        # Make many database-intensive requests
-        start_time = time.time()
-
-        for _ in range(20):
-            response = client.get("/api/v1/recipes/?query=test")
-            assert response.status_code == 200
+        # Make many database-intensive requests at once
+        search_params = {"query": "test"}
+        start_time = time.perf_counter()
+
+        responses = await asyncio.gather(
+            *(
+                async_client.get(RECIPES_URL, params=search_params)
+                for _ in range(20)
+            )
+        )
 
-        end_time = time.time()
-        total_time = end_time - start_time
+        total_time = time.perf_counter() - start_time
+        assert all(response.status_code == 200 for response in responses)
 
         # Should complete efficiently even with many DB queries
         assert total_time < 3.0
@@ -2,11 +2,12 @@
 Tests for race condition fixes in repositories.
 """
 
-import threading
+import asyncio
 from unittest.mock import patch
 
 import pytest
 
+from adapters.db import Database
 from adapters.db.recipe_repository import SQLiteRecipeRepository
 from adapters.db.shopping_list_repository import SQLiteShoppingListRepository
 from domain.entities import Ingredient, Recipe, ShoppingItem, ShoppingList
@@ -15,10 +16,17 @@ from domain.entities import Ingredient, Recipe, ShoppingItem, ShoppingList
 pytestmark = pytest.mark.race_condition
 
 
+async def _run_in_threads(func, args):
+    """Call func once per argument in worker threads and gather results."""
+    async with asyncio.TaskGroup() as group:
+        tasks = [group.create_task(asyncio.to_thread(func, a)) for a in args]
+    return [task.result() for task in tasks]
+
+
 class TestRaceConditionFixes:
     """Test that race conditions are properly handled."""
 
-    def test_concurrent_recipe_creation_same_title(self, temp_database):
+    async def test_concurrent_recipe_creation_same_title(self, temp_database):
         """Test that concurrent creation of recipes with same title is handled
         safely."""
         # Use a single repository instance to ensure proper locking
@@ -41,44 +49,16 @@ class TestRaceConditionFixes:
                 raise
 
         # Create multiple threads trying to create the same recipe
-        threads = []
-        results = []
-        errors = []
-
-        # Use a shared list to collect results safely
-        import threading
-
-        results_lock = threading.Lock()
-        errors_lock = threading.Lock()
-
-        for i in range(10):
-
-            def create_with_id(recipe_id=i):
-                try:
-                    result = create_recipe(recipe_id, repo)
-                    with results_lock:
-                        results.append(result)
-                except Exception as e:
-                    with errors_lock:
-                        errors.append(e)
-
-            thread = threading.Thread(target=create_with_id)
-            threads.append(thread)
-
-        # Start all threads simultaneously
-        for thread in threads:
-            thread.start()
-
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        results = await _run_in_threads(
+            lambda recipe_id: create_recipe(recipe_id, repo), range(10)
+        )
 
         # Check how many recipes were actually created in the database
-        all_recipes = repo.get_all(limit=100)
-        recipe_titles = [r.title for r in all_recipes]
-        concurrent_recipes = [
-            r for r in recipe_titles if r == "Concurrent Recipe"
-        ]
+        concurrent_count = sum(
+            1
+            for r in repo.get_all(limit=100)
+            if r.title == "Concurrent Recipe"
+        )
 
         # Only one recipe should be created successfully
         successful_creates = [r for r in results if r is not None]
@@ -88,10 +68,12 @@ class TestRaceConditionFixes:
 
         # Verify only one recipe exists in database
         assert (
-            len(concurrent_recipes) == 1
-        ), f"Expected 1 recipe in DB, got {len(concurrent_recipes)}"
+            concurrent_count == 1
+        ), f"Expected 1 recipe in DB, got {concurrent_count}"
 
-    def test_concurrent_recipe_creation_different_users(self, temp_database):
+    async def test_concurrent_recipe_creation_different_users(
+        self, temp_database
+    ):
         """Test that different users can create recipes with same title."""
         repo = SQLiteRecipeRepository(temp_database)
 
@@ -106,25 +88,9 @@ class TestRaceConditionFixes:
             return repo.save(recipe)
 
         # Create recipes for different users with same title
-        threads = []
-        results = []
-
-        for i in range(5):
-
-            def create_with_user(user_id=f"user-{i}"):
-                result = create_recipe(user_id)
-                results.append(result)
-
-            thread = threading.Thread(target=create_with_user)
-            threads.append(thread)
-
-        # Start all threads
-        for thread in threads:
-            thread.start()
-
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
+        results = await _run_in_threads(
+            create_recipe, [f"user-{i}" for i in range(5)]
+        )
 
         # All recipes should be created successfully (different users)
         assert len(results) == 5
@@ -136,7 +102,7 @@ class TestRaceConditionFixes:
         assert all(t == "Same Title Recipe" for t in titles)
         assert len(set(user_ids)) == 5  # All unique user IDs
 
-    def test_concurrent_shopping_list_creation(self, temp_database):
+    async def test_concurrent_shopping_list_creation(self, temp_database):
         """Test that concurrent shopping list creation is handled safely."""
         repo = SQLiteShoppingListRepository(temp_database)
 
@@ -155,31 +121,16 @@ class TestRaceConditionFixes:
                 return e
 
         # Test same thread_id and user_id (should only allow one)
-        threads = []
-        results = []
-
-        for i in range(5):
-
-            def create_with_id(thread_id=f"thread-{i}", user_id="user-1"):
-                result = create_shopping_list(thread_id, user_id)
-                results.append(result)
-
-            thread = threading.Thread(target=create_with_id)
-            threads.append(thread)
-
-        # Start all threads
-        for thread in threads:
-            thread.start()
-
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
+        results = await _run_in_threads(
+            lambda thread_id: create_shopping_list(thread_id, "user-1"),
+            [f"thread-{i}" for i in range(5)],
+        )
 
         # All should succeed (different thread_ids)
         assert len(results) == 5
         assert all(not isinstance(r, Exception) for r in results)
 
-    def test_database_connection_concurrency(self, temp_database):
+    async def test_database_connection_concurrency(self, temp_database):
         """Test that database connections handle concurrency properly."""
         repo = SQLiteRecipeRepository(temp_database)
 
@@ -202,28 +153,11 @@ class TestRaceConditionFixes:
                 print(f"Thread {recipe_id} failed: {e}")
                 return None, None
 
-        threads = []
-        results = []
-
-        results_lock = threading.Lock()
-
-        for i in range(10):  # Reduced number of threads for stability
-
-            def create_with_id(recipe_id=i):
-                result = create_and_read_recipe(recipe_id, repo)
-                with results_lock:
-                    results.append(result)
-
-            thread = threading.Thread(target=create_with_id)
-            threads.append(thread)
-
-        # Start all threads
-        for thread in threads:
-            thread.start()
-
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
+        # Reduced number of threads for stability
+        results = await _run_in_threads(
+            lambda recipe_id: create_and_read_recipe(recipe_id, repo),
+            range(10),
+        )
 
         # Filter out None results (failed threads)
         successful_results = [
@@ -239,6 +173,27 @@ class TestRaceConditionFixes:
             assert created.id == retrieved.id
             assert created.title == retrieved.title
 
+    def test_connection_pragmas(self, temp_database):
+        """Test that test connections use WAL with relaxed syncing and a
+        busy timeout."""
+        conn = temp_database.get_connection()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 10000
+
+    def test_synchronous_defaults_to_full(self, tmp_path):
+        """Test that connections are fully durable unless asked otherwise."""
+        db = Database(str(tmp_path / "durable.db"))
+        try:
+            conn = db.get_connection()
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+        finally:
+            db.close()
+
+        with pytest.raises(ValueError, match="synchronous must be one of"):
+            Database(str(tmp_path / "bad.db"), synchronous="fast")
+
     def test_transaction_rollback_on_error(self, temp_database):
         """Test that transactions are properly rolled back on errors."""
         repo = SQLiteRecipeRepository(temp_database)
@@ -7,18 +7,23 @@ including search, creation, and retrieval functionality.
 
 from unittest.mock import patch
 
+import pytest
+
 from domain.entities import DietType, Recipe
 from tests.base_test import BaseAPITest
+from tests.fixtures.recipes import TEST_USER_ID
 
 
 class TestRecipeEndpoints(BaseAPITest):
     """Test cases for recipe API endpoints."""
 
-    @patch("api.recipes.recipe_repo")
-    def test_search_recipes_basic(self, mock_repo):
-        """Test basic recipe search without filters."""
-        # Create real Recipe object for testing
-        test_recipe = Recipe(
+    @pytest.fixture(scope="class")
+    def base_recipe(self):
+        """Vegetarian recipe returned by the mocked repository.
+
+        Built once per class; tests only read it.
+        """
+        return Recipe(
             id=1,
             title="Test Recipe",
             description="Test description",
@@ -28,11 +33,13 @@ class TestRecipeEndpoints(BaseAPITest):
             servings=2,
             difficulty="easy",
             diet_type=DietType.VEGETARIAN,
-            ingredients=[],
-            tags=[],
+            user_id=TEST_USER_ID,
         )
-        test_recipe.user_id = self.test_user_id
-        mock_repo.search_recipes.return_value = [test_recipe]
+
+    @patch("api.recipes.recipe_repo")
+    def test_search_recipes_basic(self, mock_repo, base_recipe):
+        """Test basic recipe search without filters."""
+        mock_repo.search_recipes.return_value = [base_recipe]
 
         # Test request
         response = self.client.get("/api/v1/recipes/?query=pasta")
@@ -47,24 +54,9 @@ class TestRecipeEndpoints(BaseAPITest):
         assert data["recipes"][0]["title"] == "Test Recipe"
 
     @patch("api.recipes.recipe_repo")
-    def test_search_recipes_with_filters(self, mock_repo):
+    def test_search_recipes_with_filters(self, mock_repo, base_recipe):
         """Test recipe search with multiple filters."""
-        # Create real Recipe object for testing
-        test_recipe = Recipe(
-            id=1,
-            title="Vegetarian Pasta",
-            description="A healthy pasta dish",
-            instructions="Cook pasta and add sauce",
-            prep_time_minutes=15,
-            cook_time_minutes=20,
-            servings=4,
-            difficulty="easy",
-            diet_type=DietType.VEGETARIAN,
-            ingredients=[],
-            tags=[],
-        )
-        test_recipe.user_id = self.test_user_id
-        mock_repo.search_recipes.return_value = [test_recipe]
+        mock_repo.search_recipes.return_value = [base_recipe]
 
         # Test request with filters
         response = self.client.get(
@@ -102,16 +94,9 @@ class TestRecipeEndpoints(BaseAPITest):
         assert len(data["recipes"]) == 0
 
     @patch("api.recipes.recipe_repo")
-    def test_get_recipe_by_id_success(self, mock_repo):
+    def test_get_recipe_by_id_success(self, mock_repo, base_recipe):
         """Test getting a recipe by ID successfully."""
-        # Mock repository response - create real Recipe object
-        mock_recipe = Recipe(
-            id=1,
-            title="Test Recipe",
-            description="Test description",
-            instructions="Test instructions",
-        )
-        mock_repo.get_by_id.return_value = mock_recipe
+        mock_repo.get_by_id.return_value = base_recipe
 
         # Test request
         response = self.client.get("/api/v1/recipes/1")
@@ -0,0 +1,69 @@
+"""
+Tests for full-text recipe search backed by the recipes_fts index.
+"""
+
+from adapters.db.migrations import MigrationRunner
+from tests.base_test import BaseDatabaseTest
+
+
+class TestRecipeFullTextSearch(BaseDatabaseTest):
+    """Test keyword search through the FTS5 index."""
+
+    def test_search_by_keywords_matches_substrings(self):
+        """Test that keywords match inside words, ignoring case."""
+        self.recipe_repo.save(self.create_test_recipe("Creamy Pasta"))
+        self.recipe_repo.save(self.create_test_recipe("Green Salad"))
+
+        recipes = self.recipe_repo.search_by_keywords(["PAST", "salad"])
+
+        assert sorted(r.title for r in recipes) == [
+            "Creamy Pasta",
+            "Green Salad",
+        ]
+
+    def test_index_follows_updates_and_deletes(self):
+        """Test that triggers keep the index in sync with recipes."""
+        recipe = self.recipe_repo.save(self.create_test_recipe("Old Title"))
+
+        recipe.title = "New Title"
+        self.recipe_repo.save(recipe)
+        assert self.recipe_repo.search_by_keywords(["Old Title"]) == []
+        assert len(self.recipe_repo.search_by_keywords(["New Title"])) == 1
+
+        self.recipe_repo.delete(recipe.id)
+        assert self.recipe_repo.search_by_keywords(["New Title"]) == []
+
+    def test_short_query_falls_back_to_like(self):
+        """Test that queries shorter than a trigram still match."""
+        self.recipe_repo.save(self.create_test_recipe("Pasta"))
+
+        assert len(self.recipe_repo.search_by_keywords(["as"])) == 1
+        assert len(self.recipe_repo.search_recipes(query="as")) == 1
+
+    def test_search_recipes_uses_instructions(self):
+        """Test that search_recipes also matches recipe instructions."""
+        self.recipe_repo.save(self.create_test_recipe("Pasta"))
+
+        recipes = self.recipe_repo.search_recipes(
+            query="instructions", user_id=self.test_user_id
+        )
+
+        assert [r.title for r in recipes] == ["Pasta"]
+
+
+def test_split_sql_keeps_trigger_body():
+    """Test that semicolons inside a trigger body do not split it."""
+    sql = """
+        CREATE TABLE t (a TEXT);
+        CREATE TRIGGER t_ai AFTER INSERT ON t BEGIN
+            INSERT INTO log VALUES (new.a);
+            INSERT INTO log VALUES ('x;y');
+        END;
+        SELECT 1;
+    """
+
+    statements = MigrationRunner(None)._split_sql_statements(sql)
+
+    assert len(statements) == 3
+    assert statements[1].startswith("CREATE TRIGGER")
+    assert statements[1].endswith("END")